@@ -3,7 +3,7 @@ import random
 
 from dhenara.ai import AIModelClient
 from dhenara.ai.types import AIModelAPI, AIModelAPIProviderEnum, AIModelCallConfig, AIModelEndpoint
-from dhenara.ai.types.conversation import ConversationNode
+from dhenara.ai.types.conversation import ConversationNode, get_conversation_context
 from dhenara.ai.types.genai.foundation_models.anthropic.chat import Claude35Haiku, Claude37Sonnet
 from dhenara.ai.types.genai.foundation_models.google.chat import Gemini20Flash, Gemini20FlashLite
 from dhenara.ai.types.genai.foundation_models.openai.chat import GPT4oMini, O3Mini
@@ -52,9 +52,7 @@ def handle_conversation_turn(
     )
 
     prompt = user_query
-    context = []
-    for node in conversation_nodes:
-        context += node.get_context()
+    context = get_conversation_context(conversation_nodes)
 
     # Generate response
     response = client.generate(
@@ -1,9 +1,10 @@
 import datetime
-import random
 
 from dhenara.ai import AIModelClient
+from dhenara.ai.pool import EndpointPool
 from dhenara.ai.types import AIModelAPIProviderEnum, AIModelCallConfig, AIModelEndpoint, ResourceConfig
-from dhenara.ai.types.conversation._node import ConversationNode
+from dhenara.ai.types.conversation import ConversationNode
+from dhenara.ai.types.genai.dhenara.request import Prompt
 from dhenara.ai.types.genai.foundation_models.anthropic.chat import Claude35Haiku, Claude37Sonnet
 from dhenara.ai.types.genai.foundation_models.google.chat import Gemini20Flash, Gemini20FlashLite
 from dhenara.ai.types.genai.foundation_models.openai.chat import GPT41Nano, O3Mini
@@ -29,12 +30,15 @@ resource_config.model_endpoints = [
     AIModelEndpoint(api=google_api, ai_model=Gemini20FlashLite),
 ]
 
+# Tracks endpoint health, so that endpoints which recently failed are not picked
+endpoint_pool = EndpointPool(endpoints=resource_config.model_endpoints)
+
 
 def handle_conversation_turn(
     user_query: str,
     instructions: list[str],
     endpoint: AIModelEndpoint,
-    conversation_nodes: list[ConversationNode],
+    context: list[Prompt],
 ) -> ConversationNode:
     """Process a single conversation turn with the specified model and query."""
 
@@ -48,9 +52,6 @@ def handle_conversation_turn(
     )
 
     prompt = user_query
-    context = []
-    for node in conversation_nodes:
-        context += node.get_context()
 
     # Generate response
     response = client.generate(
@@ -77,30 +78,36 @@ def run_multi_turn_conversation():
         "Conclude the story with an inspiring ending.",
     ]
 
-    # Instructions for each turn
-    instructions_by_turn = [
-        ["Be creative and engaging."],
-        ["Build upon the previous story seamlessly."],
-        ["Bring the story to a satisfying conclusion."],
+    # Instructions are sent ahead of the context, so keep them same for the whole conversation.
+    # Changing instructions between turns will invalidate the provider side prompt cache.
+    # Put any per-turn guidance in the user query instead.
+    instructions = [
+        "Be creative and engaging.",
+        "Build upon the previous parts of the story seamlessly.",
     ]
 
     # Store conversation history
     conversation_nodes = []
+    # Context prompts of all previous turns. Only the latest turn is appended on each iteration, so that
+    # older turns are never re-built and the prefix sent to the API stays identical across turns.
+    # This is what lets provider side prompt caching (Eg: Anthropic/OpenAI) hit on the history.
+    context_cache: list[Prompt] = []
+
+    # Choose a random model endpoint, and pin it for the whole conversation.
+    # Switching providers between turns will invalidate the provider side prompt cache.
+    model_endpoint = endpoint_pool.random_healthy()
+    # OR choose if fixed order as
+    # model_endpoint = resource_config.get_model_endpoint(model_name=Claude35Haiku.model_name)
 
     # Process each turn
     for i, query in enumerate(multi_turn_queries):
-        # Choose a random model endpoint
-        model_endpoint = random.choice(resource_config.model_endpoints)
-        # OR choose if fixed order as
-        # model_endpoint = resource_config.get_model_endpoint(model_name=Claude35Haiku.model_name)
-
         print(f"🔄 Turn {i + 1} with {model_endpoint.ai_model.model_name} from {model_endpoint.api.provider}\n")
 
         node = handle_conversation_turn(
             user_query=query,
-            instructions=instructions_by_turn[i],  # Only if you need to change instruction on each turn, else leave []
+            instructions=instructions,
             endpoint=model_endpoint,
-            conversation_nodes=conversation_nodes,
+            context=context_cache,
         )
 
         # Display the conversation
@@ -110,8 +117,9 @@ def run_multi_turn_conversation():
             print(f"Model Response Content {content.index}:\n{content.get_text()}\n")
         print("-" * 80)
 
-        # Append to nodes, so that next turn will have the context generated
+        # Append to nodes and context, so that next turn will have the context generated
         conversation_nodes.append(node)
+        context_cache.extend(node.get_context())
 
 
 if __name__ == "__main__":
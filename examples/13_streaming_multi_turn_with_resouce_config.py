@@ -10,7 +10,7 @@ from dhenara.ai.types import (
     ChatResponseChunk,
     ResourceConfig,
 )
-from dhenara.ai.types.conversation import ConversationNode
+from dhenara.ai.types.conversation import ConversationNode, get_conversation_context
 from dhenara.ai.types.genai.foundation_models.anthropic.chat import Claude35Haiku
 from dhenara.ai.types.genai.foundation_models.google.chat import Gemini20FlashLite
 from dhenara.ai.types.genai.foundation_models.openai.chat import GPT4oMini
@@ -118,9 +118,7 @@ def handle_streaming_conversation_turn(
     )
 
     prompt = user_query
-    context = []
-    for node in conversation_nodes:
-        context += node.get_context()
+    context = get_conversation_context(conversation_nodes)
 
     # Generate streaming response
     response = client.generate(
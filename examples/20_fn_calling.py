@@ -15,7 +15,7 @@ from dhenara.ai.types import (
     ToolChoice,
     ToolDefinition,
 )
-from dhenara.ai.types.conversation import ConversationNode
+from dhenara.ai.types.conversation import ConversationNode, get_conversation_context
 from dhenara.ai.types.genai.foundation_models.anthropic.chat import Claude35Haiku
 from dhenara.ai.types.genai.foundation_models.google.chat import Gemini20FlashLite
 from dhenara.ai.types.genai.foundation_models.openai.chat import GPT4oMini
@@ -158,9 +158,7 @@ def handle_conversation_turn(
         is_async=False,
     )
 
-    context = []
-    for node in conversation_nodes:
-        context += node.get_context()
+    context = get_conversation_context(conversation_nodes)
 
     # Generate response
     response = client.generate(
@@ -1,3 +1,4 @@
+import asyncio
 import datetime
 import logging
 import random
@@ -5,6 +6,8 @@ import random
 from pydantic import BaseModel, Field
 
 from dhenara.ai import AIModelClient
+from dhenara.ai.cache import InMemoryLRUResponseCache
+from dhenara.ai.concurrency import run_many
 from dhenara.ai.types import (
     AIModelAPIProviderEnum,
     AIModelCallConfig,
@@ -13,6 +16,7 @@ from dhenara.ai.types import (
     # StructuredOutputConfig,
 )
 from dhenara.ai.types.conversation import ConversationNode
+from dhenara.ai.types.genai.dhenara.request import Prompt
 from dhenara.ai.types.genai.foundation_models.anthropic.chat import Claude35Haiku
 from dhenara.ai.types.genai.foundation_models.google.chat import Gemini20FlashLite
 from dhenara.ai.types.genai.foundation_models.openai.chat import GPT4oMini
@@ -44,6 +48,10 @@ resource_config.model_endpoints = [
     AIModelEndpoint(api=google_api, ai_model=Gemini20FlashLite),
 ]
 
+# Identical requests are served from this cache without an API call.
+# Use `DiskJSONResponseCache(cache_dir=...)` to persist responses across runs
+response_cache = InMemoryLRUResponseCache(max_size=256)
+
 
 class ProductRatings(BaseModel):
     rating: int = Field(..., description="Rating from 1-5", ge=1, le=5)
@@ -60,16 +68,9 @@ class ProductReview(BaseModel):
     summary: str = Field(..., description="Short summary of the review")
 
 
-def handle_conversation_turn(
-    user_query: str,
-    instructions: list[str],
-    endpoint: AIModelEndpoint,
-    conversation_nodes: list[ConversationNode],
-) -> ConversationNode:
-    """Process a single conversation turn with the specified model and query."""
-    # Create config with function calling
-
-    client = AIModelClient(
+def create_client(endpoint: AIModelEndpoint) -> AIModelClient:
+    """Create a client for structured output. Create once and reuse it across turns."""
+    return AIModelClient(
         model_endpoint=endpoint,
         config=AIModelCallConfig(
             max_output_tokens=1000,
@@ -84,13 +85,20 @@ def handle_conversation_turn(
             structured_output=ProductReview,
         ),
         is_async=False,
+        response_cache=response_cache,
     )
 
-    context = []
-    for node in conversation_nodes:
-        context += node.get_context()
 
-    # Generate response
+def handle_conversation_turn(
+    user_query: str,
+    instructions: list[str],
+    client: AIModelClient,
+    context: list[Prompt],
+) -> ConversationNode:
+    """Process a single conversation turn with the specified client and query."""
+
+    # Generate response.
+    # A plain text query is converted straight to the provider format, without building a `Prompt` first
     response = client.generate(
         prompt=user_query,
         context=context,
@@ -118,21 +126,24 @@ def run_multi_turn_conversation():
 
     # Store conversation history
     conversation_nodes = []
+    # Context prompts of all previous turns, extended by the latest turn only, so that the prefix stays identical
+    context_cache: list[Prompt] = []
+
+    # Choose a random model endpoint, and create the client once for the whole conversation
+    model_endpoint = random.choice(resource_config.model_endpoints)
+    # OR choose if fixed order as
+    # model_endpoint = resource_config.get_model_endpoint(model_name=Claude35Haiku.model_name)
+    client = create_client(model_endpoint)
 
     # Process each turn
     for i, query in enumerate(multi_turn_queries):
-        # Choose a random model endpoint
-        model_endpoint = random.choice(resource_config.model_endpoints)
-        # OR choose if fixed order as
-        # model_endpoint = resource_config.get_model_endpoint(model_name=Claude35Haiku.model_name)
-
         print(f"🔄 Turn {i + 1} with {model_endpoint.ai_model.model_name} from {model_endpoint.api.provider}\n")
 
         node = handle_conversation_turn(
             user_query=query,
             instructions=instructions_by_turn[i],  # Only if you need to change instruction on each turn, else leave []
-            endpoint=model_endpoint,
-            conversation_nodes=conversation_nodes,
+            client=client,
+            context=context_cache,
         )
 
         # Display the conversation
@@ -142,9 +153,44 @@ def run_multi_turn_conversation():
             print(f"Model Response Content {content.index}:\n{content.get_text()}\n")
         print("-" * 80)
 
-        # Append to nodes, so that next turn will have the context generated
+        # Append to nodes and context, so that next turn will have the context generated
         conversation_nodes.append(node)
+        context_cache.extend(node.get_context())
+
+
+def run_independent_reviews():
+    """Reviews without a shared conversation history are independent, so generate them concurrently"""
+    queries = [
+        "Write a review for the iPhone 15 Pro Max.",
+        "Write a review for the Samsung Galaxy S24 Ultra.",
+        "Write a review for the Google Pixel 8 Pro.",
+    ]
+
+    model_endpoint = random.choice(resource_config.model_endpoints)
+    print(f"🔄 {len(queries)} reviews with {model_endpoint.ai_model.model_name} from {model_endpoint.api.provider}\n")
+
+    client = AIModelClient(
+        model_endpoint=model_endpoint,
+        config=AIModelCallConfig(
+            max_output_tokens=1000,
+            streaming=False,
+            structured_output=ProductReview,
+        ),
+        is_async=True,
+        response_cache=response_cache,
+    )
+
+    if len(queries) > 1:
+        responses = asyncio.run(run_many(client, prompts=queries, concurrency=4))
+    else:
+        responses = [asyncio.run(client.generate_async(prompt=queries[0]))]
+
+    for query, response in zip(queries, responses, strict=True):
+        print(f"User: {query}")
+        print(f"Model Response:\n{response.chat_response.structured()}\n")
+        print("-" * 80)
 
 
 if __name__ == "__main__":
     run_multi_turn_conversation()
+    run_independent_reviews()
@@ -48,6 +48,10 @@ setup(
             "ruff",
             "add-trailing-comma",
         ],
+        # Faster JSON encoding of API request bodies
+        "fast-json": [
+            "orjson>=3.9.0",
+        ],
         # TODO_FUTURE
         # "azure": [
         #    "azure-ai-inference>=1.0.0",
@@ -0,0 +1,76 @@
+import asyncio
+import threading
+import weakref
+from collections.abc import Awaitable, Callable
+from concurrent.futures import Future
+from typing import Any
+
+
+class SingleFlight:
+    """
+    Coalesces identical concurrent calls.
+
+    While a call for a key is in flight, other calls with the same key wait for it and get its result,
+    instead of running again. Entries are removed as soon as the call completes, so only in-flight
+    calls are tracked. Async calls are coalesced within an event loop.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._sync_calls: dict[str, Future] = {}
+        self._async_calls: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, asyncio.Future]] = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def do_sync(self, key: str, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            future = self._sync_calls.get(key)
+            is_leader = future is None
+            if is_leader:
+                future = Future()
+                self._sync_calls[key] = future
+
+        if not is_leader:
+            return future.result()
+
+        try:
+            result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                self._sync_calls.pop(key, None)
+
+    async def do_async(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            calls = self._async_calls.get(loop)
+            if calls is None:
+                calls = {}
+                self._async_calls[loop] = calls
+
+        task = calls.get(key)
+        if task is None:
+            # Run the call in a task of its own, so that it outlives a cancelled caller, including the first one
+            task = asyncio.ensure_future(fn())
+            calls[key] = task
+            task.add_done_callback(lambda t: self._on_async_call_done(calls, key, t))
+
+        # Shield, so that a cancelled caller doesn't cancel the call for the others
+        return await asyncio.shield(task)
+
+    @staticmethod
+    def _on_async_call_done(calls: dict[str, asyncio.Future], key: str, task: asyncio.Future) -> None:
+        if calls.get(key) is task:
+            del calls[key]
+        if not task.cancelled():
+            # Mark the exception as retrieved, as all callers may have been cancelled
+            task.exception()
+
+
+# Shared by all clients, so that identical calls from different clients are coalesced too
+single_flight = SingleFlight()
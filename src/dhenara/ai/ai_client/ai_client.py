@@ -4,9 +4,11 @@ from concurrent.futures import ThreadPoolExecutor
 from concurrent.futures import TimeoutError as FuturesTimeoutError
 from contextlib import AsyncExitStack, ExitStack, contextmanager
 
+from dhenara.ai.cache import ResponseCache, ResponseCacheKey, is_cacheable_response, make_response_cache_key
 from dhenara.ai.types import AIModelCallConfig, AIModelCallResponse, AIModelEndpoint
 from dhenara.ai.types.genai.dhenara.request import Prompt, SystemInstruction
 
+from ._single_flight import single_flight
 from .factory import AIModelClientFactory
 
 
@@ -19,11 +21,16 @@ class AIModelClient:
     - Automatic retries with exponential backoff
     - Request timeouts
     - Resource cleanup
+    - Optional response caching
+    - Optional coalescing of identical concurrent requests
 
     Attributes:
         model_endpoint (AIModelEndpoint): The AI model endpoint configuration
         config (AIModelCallConfig): Configuration for API calls including timeouts and retries
         is_async (bool): Async client or not
+        response_cache (ResponseCache | None): Cache for non-streaming responses. On a hit, the API call is skipped
+        coalesce_requests (bool): Share one API call between identical concurrent non-streaming requests,
+            including those from other clients. Callers then get the same response object
     """
 
     def __init__(
@@ -31,10 +38,14 @@ class AIModelClient:
         model_endpoint: AIModelEndpoint,
         config: AIModelCallConfig | None = None,
         is_async: bool = True,
+        response_cache: ResponseCache | None = None,
+        coalesce_requests: bool = False,
     ):
         self.model_endpoint = model_endpoint
         self.config = config or AIModelCallConfig()
         self.is_async = is_async
+        self.response_cache = response_cache
+        self.coalesce_requests = coalesce_requests
         self._provider_client = None
         self._client_stack = AsyncExitStack() if is_async else ExitStack()
 
@@ -160,6 +171,47 @@ class AIModelClient:
                 await stack.enter_async_context(asyncio.timeout(self.config.timeout))
             return await self._provider_client._format_and_generate_response_async(*args, **kwargs)
 
+    # Response cache and request coalescing
+    def _get_request_key(
+        self,
+        prompt: str | dict | Prompt,
+        context: list[str | dict | Prompt] | None = None,
+        instructions: list[str | dict | SystemInstruction] | None = None,
+    ) -> ResponseCacheKey | None:
+        if self.config.streaming or (self.response_cache is None and not self.coalesce_requests):
+            return None
+
+        return make_response_cache_key(
+            model_endpoint=self.model_endpoint,
+            config=self.config,
+            prompt=prompt,
+            context=context,
+            instructions=instructions,
+        )
+
+    def _get_cached_response(self, cache_key: ResponseCacheKey | None) -> AIModelCallResponse | None:
+        if cache_key is None or self.response_cache is None:
+            return None
+        return self.response_cache.get(cache_key)
+
+    def _cache_response(
+        self,
+        cache_key: ResponseCacheKey | None,
+        response: AIModelCallResponse | None,
+    ) -> None:
+        if cache_key is not None and self.response_cache is not None and is_cacheable_response(response):
+            self.response_cache.put(cache_key, response)
+
+    def _run_coalesced_sync(self, cache_key: ResponseCacheKey | None, fn):
+        if cache_key is None or not self.coalesce_requests:
+            return fn()
+        return single_flight.do_sync(cache_key.digest, fn)
+
+    async def _run_coalesced_async(self, cache_key: ResponseCacheKey | None, fn):
+        if cache_key is None or not self.coalesce_requests:
+            return await fn()
+        return await single_flight.do_async(cache_key.digest, fn)
+
     # Genereate Response Fns
     def generate(
         self,
@@ -173,12 +225,23 @@ class AIModelClient:
                 f"This client is created with is_async={self.is_async}. Use generate_async for async client"
             )
 
-        with self as client:  # noqa: F841
-            return self._execute_with_retry_sync(
-                prompt=prompt,
-                context=context,
-                instructions=instructions,
-            )
+        cache_key = self._get_request_key(prompt, context, instructions)
+        cached_response = self._get_cached_response(cache_key)
+        if cached_response is not None:
+            return cached_response
+
+        def _generate():
+            with self as client:  # noqa: F841
+                response = self._execute_with_retry_sync(
+                    prompt=prompt,
+                    context=context,
+                    instructions=instructions,
+                )
+
+            self._cache_response(cache_key, response)
+            return response
+
+        return self._run_coalesced_sync(cache_key, _generate)
 
     async def generate_async(
         self,
@@ -190,12 +253,23 @@ class AIModelClient:
         if not self.is_async:
             raise RuntimeError(f"This client is created with is_async={self.is_async}. Use generate for sync client")
 
-        async with self as client:  # noqa: F841
-            return await self._execute_with_retry_async(
-                prompt=prompt,
-                context=context,
-                instructions=instructions,
-            )
+        cache_key = self._get_request_key(prompt, context, instructions)
+        cached_response = self._get_cached_response(cache_key)
+        if cached_response is not None:
+            return cached_response
+
+        async def _generate():
+            async with self as client:  # noqa: F841
+                response = await self._execute_with_retry_async(
+                    prompt=prompt,
+                    context=context,
+                    instructions=instructions,
+                )
+
+            self._cache_response(cache_key, response)
+            return response
+
+        return await self._run_coalesced_async(cache_key, _generate)
 
     async def generate_with_existing_connection(
         self,
@@ -237,6 +311,11 @@ class AIModelClient:
         context: list[str | dict | Prompt] | None = None,
         instructions: list[str | dict | SystemInstruction] | None = None,
     ) -> AIModelCallResponse:
+        cache_key = self._get_request_key(prompt, context, instructions)
+        cached_response = self._get_cached_response(cache_key)
+        if cached_response is not None:
+            return cached_response
+
         if not self._provider_client:
             self._provider_client = self._client_stack.enter_context(
                 AIModelClientFactory.create_provider_client(
@@ -245,11 +324,18 @@ class AIModelClient:
                     is_async=False,
                 ),
             )
-        return self._execute_with_retry_sync(
-            prompt=prompt,
-            context=context,
-            instructions=instructions,
-        )
+
+        def _generate():
+            response = self._execute_with_retry_sync(
+                prompt=prompt,
+                context=context,
+                instructions=instructions,
+            )
+
+            self._cache_response(cache_key, response)
+            return response
+
+        return self._run_coalesced_sync(cache_key, _generate)
 
     def cleanup_sync(self) -> None:
         """
@@ -267,6 +353,11 @@ class AIModelClient:
         context: list[str | dict | Prompt] | None = None,
         instructions: list[str | dict | SystemInstruction] | None = None,
     ) -> AIModelCallResponse:
+        cache_key = self._get_request_key(prompt, context, instructions)
+        cached_response = self._get_cached_response(cache_key)
+        if cached_response is not None:
+            return cached_response
+
         if not self._provider_client:
             self._provider_client = await self._client_stack.enter_async_context(
                 AIModelClientFactory.create_provider_client(
@@ -275,11 +366,18 @@ class AIModelClient:
                     is_async=True,
                 ),
             )
-        return await self._execute_with_retry_async(
-            prompt=prompt,
-            context=context,
-            instructions=instructions,
-        )
+
+        async def _generate():
+            response = await self._execute_with_retry_async(
+                prompt=prompt,
+                context=context,
+                instructions=instructions,
+            )
+
+            self._cache_response(cache_key, response)
+            return response
+
+        return await self._run_coalesced_async(cache_key, _generate)
 
     async def cleanup_async(self) -> None:
         """
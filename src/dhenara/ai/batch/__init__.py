@@ -0,0 +1,2 @@
+# ruff: noqa: F401
+from .runner import BatchRequest, BatchRunner, BatchRunResult
@@ -0,0 +1,205 @@
+import asyncio
+import json
+import logging
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from dhenara.ai.ai_client import AIModelClient
+from dhenara.ai.cache import is_cacheable_response, make_response_cache_key
+from dhenara.ai.types import AIModelCallResponse
+from dhenara.ai.types.genai.dhenara.request import Prompt, SystemInstruction
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BatchRequest:
+    """
+    A single request of a batch.
+
+    Attributes:
+        prompt: The prompt to generate a response for
+        context: Optional conversation context
+        instructions: Optional system instructions
+        key: Unique key of the request in the batch. Derived from the request contents when not set, so
+            identical requests without a key share a key, and are run once
+    """
+
+    prompt: str | dict | Prompt
+    context: list[str | dict | Prompt] | None = None
+    instructions: list[str | dict | SystemInstruction] | None = None
+    key: str | None = None
+
+
+@dataclass
+class BatchRunResult:
+    """Keys of the requests processed in a batch run"""
+
+    completed: list[str] = field(default_factory=list)
+    skipped: list[str] = field(default_factory=list)
+    failed: list[str] = field(default_factory=list)
+
+
+class BatchRunner:
+    """
+    Runs a batch of independent requests, checkpointing each response to a JSONL file.
+
+    Every successful response is appended to `output_jsonl` as soon as it is received. On a re-run
+    with the same file, requests whose keys are already in the file are skipped, so an interrupted
+    batch resumes where it stopped. Failed requests are not written, and are retried on the next run.
+
+    Identical requests without an explicit key are deduplicated, and their key is reported once in the
+    result. Set distinct keys to run identical requests more than once, Eg: to collect several samples.
+
+    Args:
+        client: An async, non-streaming AIModelClient
+        output_jsonl: Path of the JSONL file responses are written to
+        concurrency: Maximum number of in-flight requests
+        retries: Attempts per request, before it is marked failed
+        retry_delay: Initial delay in seconds between attempts, doubled on every attempt
+        max_retry_delay: Maximum delay in seconds between attempts
+    """
+
+    def __init__(
+        self,
+        client: AIModelClient,
+        output_jsonl: str | Path,
+        concurrency: int = 16,
+        retries: int = 3,
+        retry_delay: float = 1.0,
+        max_retry_delay: float = 30.0,
+    ):
+        if not client.is_async:
+            raise ValueError("BatchRunner: client should be created with is_async=True")
+        if client.config.streaming:
+            raise ValueError("BatchRunner: streaming is not supported")
+        if concurrency < 1:
+            raise ValueError(f"BatchRunner: concurrency should be at least 1, got {concurrency}")
+        if retries < 1:
+            raise ValueError(f"BatchRunner: retries should be at least 1, got {retries}")
+
+        self.client = client
+        self.output_jsonl = Path(output_jsonl).expanduser()
+        self.concurrency = concurrency
+        self.retries = retries
+        self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
+
+    def get_request_key(self, request: BatchRequest) -> str:
+        if request.key is not None:
+            return request.key
+
+        return make_response_cache_key(
+            model_endpoint=self.client.model_endpoint,
+            config=self.client.config,
+            prompt=request.prompt,
+            context=request.context,
+            instructions=request.instructions,
+        ).digest
+
+    def _read_entries(self) -> Iterable[dict]:
+        if not self.output_jsonl.exists():
+            return
+
+        with open(self.output_jsonl) as f:
+            for line_no, line in enumerate(f, start=1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    # A run killed mid-write leaves a partial last line
+                    logger.warning(f"BatchRunner: Skipping invalid line {line_no} in {self.output_jsonl}")
+
+    def get_completed_keys(self) -> set[str]:
+        """Returns the keys of requests already in the output file"""
+        return {entry["key"] for entry in self._read_entries() if "key" in entry}
+
+    def load_responses(self) -> dict[str, AIModelCallResponse]:
+        """Returns the responses in the output file, by request key"""
+        return {
+            entry["key"]: AIModelCallResponse.model_validate(entry["response"])
+            for entry in self._read_entries()
+            if "key" in entry
+        }
+
+    def _prepare_output_file(self) -> None:
+        self.output_jsonl.parent.mkdir(parents=True, exist_ok=True)
+        if not self.output_jsonl.exists() or self.output_jsonl.stat().st_size == 0:
+            return
+
+        # Terminate a partial last line, so that new entries start on a line of their own
+        with open(self.output_jsonl, "rb+") as f:
+            f.seek(-1, 2)
+            if f.read(1) != b"\n":
+                f.write(b"\n")
+
+    def _append_line(self, line: str) -> None:
+        with open(self.output_jsonl, "a") as f:
+            f.write(line + "\n")
+
+    async def _generate(self, key: str, request: BatchRequest) -> AIModelCallResponse | None:
+        for attempt in range(self.retries):
+            try:
+                response = await self.client.generate_with_existing_connection_async(
+                    prompt=request.prompt,
+                    context=request.context,
+                    instructions=request.instructions,
+                )
+                if is_cacheable_response(response):
+                    return response
+                logger.error(f"BatchRunner: Request {key} failed on attempt {attempt + 1}")
+            except Exception as e:
+                logger.error(f"BatchRunner: Request {key} failed on attempt {attempt + 1}: {e}")
+
+            if attempt < self.retries - 1:
+                await asyncio.sleep(min(self.retry_delay * (2**attempt), self.max_retry_delay))
+
+        return None
+
+    async def run(self, requests: Iterable[BatchRequest]) -> BatchRunResult:
+        """Run the requests not already in the output file, and append their responses to it"""
+        result = BatchRunResult()
+        completed_keys = self.get_completed_keys()
+
+        pending: dict[str, BatchRequest] = {}
+        skipped_keys: set[str] = set()
+        for request in requests:
+            key = self.get_request_key(request)
+            if key in completed_keys:
+                if key not in skipped_keys:
+                    skipped_keys.add(key)
+                    result.skipped.append(key)
+            elif key in pending:
+                if request.key is not None:
+                    raise ValueError(f"BatchRunner: Duplicate request key {key}")
+                # Identical to an earlier request, whose response serves both
+            else:
+                pending[key] = request
+
+        if not pending:
+            return result
+
+        self._prepare_output_file()
+        semaphore = asyncio.Semaphore(self.concurrency)
+        write_lock = asyncio.Lock()
+
+        async def _process(key: str, request: BatchRequest):
+            async with semaphore:
+                response = await self._generate(key, request)
+
+            if response is None:
+                result.failed.append(key)
+                return
+
+            line = json.dumps({"key": key, "response": response.model_dump(mode="json")})
+            async with write_lock:
+                await asyncio.to_thread(self._append_line, line)
+            result.completed.append(key)
+
+        async with self.client:
+            await asyncio.gather(*(_process(key, request) for key, request in pending.items()))
+
+        return result
@@ -0,0 +1,10 @@
+# ruff: noqa: F401
+from .response_cache import (
+    DiskJSONResponseCache,
+    InMemoryLRUResponseCache,
+    ResponseCache,
+    ResponseCacheKey,
+    SemanticResponseCache,
+    is_cacheable_response,
+    make_response_cache_key,
+)
@@ -0,0 +1,295 @@
+import hashlib
+import json
+import logging
+import math
+import os
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel as PydanticBaseModel
+
+from dhenara.ai.types import AIModelCallConfig, AIModelCallResponse, AIModelEndpoint, ExternalApiCallStatusEnum
+from dhenara.ai.types.genai.dhenara.request import Prompt, SystemInstruction
+
+logger = logging.getLogger(__name__)
+
+# Call-config fields which changes the generated output, and hence part of the cache key
+_CONFIG_KEY_FIELDS = {
+    "max_output_tokens",
+    "reasoning",
+    "max_reasoning_tokens",
+    "options",
+    "tools",
+    "tool_choice",
+    "structured_output",
+    "test_mode",
+}
+
+
+@dataclass(frozen=True)
+class ResponseCacheKey:
+    """
+    Key of a cached response.
+
+    Attributes:
+        digest: Hash of the full request. Used for exact matches
+        scope: Hash of the request excluding the prompt. Semantic matches are only done within a scope
+        query: Text of the prompt, used for semantic matches
+    """
+
+    digest: str
+    scope: str
+    query: str | None = None
+
+
+def _to_jsonable(obj: Any) -> Any:
+    if isinstance(obj, PydanticBaseModel):
+        return obj.model_dump()
+    elif isinstance(obj, dict):
+        return {str(k): _to_jsonable(v) for k, v in obj.items()}
+    elif isinstance(obj, (list, tuple)):
+        return [_to_jsonable(v) for v in obj]
+    return obj
+
+
+def _hash(data: Any) -> str:
+    serialized = json.dumps(_to_jsonable(data), sort_keys=True, default=str)
+    return hashlib.sha256(serialized.encode()).hexdigest()
+
+
+def _get_query_text(prompt: str | dict | Prompt) -> str | None:
+    try:
+        if isinstance(prompt, str):
+            return prompt
+        elif isinstance(prompt, dict):
+            return Prompt(**prompt).get_formatted_text()
+        elif isinstance(prompt, Prompt):
+            return prompt.get_formatted_text()
+    except Exception as e:
+        logger.debug(f"response_cache: Failed to get query text from prompt: {e}")
+    return None
+
+
+def make_response_cache_key(
+    model_endpoint: AIModelEndpoint,
+    config: AIModelCallConfig,
+    prompt: str | dict | Prompt,
+    context: list[str | dict | Prompt] | None = None,
+    instructions: list[str | dict | SystemInstruction] | None = None,
+) -> ResponseCacheKey:
+    """Create the cache key for a generation request"""
+    scope_data = {
+        "api_provider": model_endpoint.api.provider,
+        "model": model_endpoint.ai_model.model_name_with_version_suffix,
+        "context": context or [],
+        "instructions": instructions or [],
+        "config": config.model_dump(include=_CONFIG_KEY_FIELDS),
+    }
+    scope = _hash(scope_data)
+    digest = _hash({"scope": scope, "prompt": prompt})
+
+    return ResponseCacheKey(
+        digest=digest,
+        scope=scope,
+        query=_get_query_text(prompt),
+    )
+
+
+def is_cacheable_response(response: AIModelCallResponse | None) -> bool:
+    """Only successful non-streaming responses are cached"""
+    return (
+        response is not None
+        and response.stream_generator is None
+        and response.status is not None
+        and response.status.status == ExternalApiCallStatusEnum.RESPONSE_RECEIVED_SUCCESS
+    )
+
+
+class ResponseCache(ABC):
+    """Base class for response caches"""
+
+    @abstractmethod
+    def get(self, key: ResponseCacheKey) -> AIModelCallResponse | None:
+        """Return the cached response for the key, or None on a miss"""
+        pass
+
+    @abstractmethod
+    def put(self, key: ResponseCacheKey, response: AIModelCallResponse, ttl: float | None = None) -> None:
+        """Store a response. `ttl` is in seconds, None for the cache default"""
+        pass
+
+    @staticmethod
+    def _get_expiry(ttl: float | None) -> float | None:
+        return time.time() + ttl if ttl is not None else None
+
+    @staticmethod
+    def _is_expired(expires_at: float | None) -> bool:
+        return expires_at is not None and expires_at < time.time()
+
+
+class InMemoryLRUResponseCache(ResponseCache):
+    """
+    Process local response cache with LRU eviction.
+
+    Responses are copied on put and on every hit, so that callers modifying a response don't change
+    the cached one.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl: float | None = None):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[float | None, AIModelCallResponse]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: ResponseCacheKey) -> AIModelCallResponse | None:
+        with self._lock:
+            entry = self._entries.get(key.digest)
+            if entry is None:
+                return None
+
+            expires_at, response = entry
+            if self._is_expired(expires_at):
+                del self._entries[key.digest]
+                return None
+
+            self._entries.move_to_end(key.digest)
+
+        return response.model_copy(deep=True)
+
+    def put(self, key: ResponseCacheKey, response: AIModelCallResponse, ttl: float | None = None) -> None:
+        expires_at = self._get_expiry(ttl if ttl is not None else self.ttl)
+        response = response.model_copy(deep=True)
+        with self._lock:
+            self._entries[key.digest] = (expires_at, response)
+            self._entries.move_to_end(key.digest)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class DiskJSONResponseCache(ResponseCache):
+    """Response cache persisted as one JSON file per request in `cache_dir`"""
+
+    def __init__(self, cache_dir: str | Path, ttl: float | None = None):
+        self.cache_dir = Path(cache_dir).expanduser()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+
+    def _get_path(self, key: ResponseCacheKey) -> Path:
+        return self.cache_dir / f"{key.digest}.json"
+
+    def get(self, key: ResponseCacheKey) -> AIModelCallResponse | None:
+        path = self._get_path(key)
+        try:
+            with open(path) as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.error(f"DiskJSONResponseCache: Failed to read {path}: {e}")
+            return None
+
+        if self._is_expired(entry.get("expires_at")):
+            path.unlink(missing_ok=True)
+            return None
+
+        try:
+            return AIModelCallResponse.model_validate(entry["response"])
+        except Exception as e:
+            logger.error(f"DiskJSONResponseCache: Invalid cache entry {path}: {e}")
+            return None
+
+    def put(self, key: ResponseCacheKey, response: AIModelCallResponse, ttl: float | None = None) -> None:
+        entry = {
+            "expires_at": self._get_expiry(ttl if ttl is not None else self.ttl),
+            "response": response.model_dump(mode="json"),
+        }
+        # Write to a temp file first, so that readers never see a partially written entry
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, self._get_path(key))
+        except Exception as e:
+            logger.error(f"DiskJSONResponseCache: Failed to write cache entry: {e}")
+            Path(tmp_path).unlink(missing_ok=True)
+
+
+class SemanticResponseCache(ResponseCache):
+    """
+    Two tier response cache.
+
+    Lookups are first done on the exact request in the underlying `cache`. On a miss, the prompt text
+    is embedded with `embed_fn` and matched against prompts of previously cached requests with the
+    same model, config, context and instructions. A match within `threshold` cosine distance is a hit.
+    """
+
+    def __init__(
+        self,
+        embed_fn: Callable[[str], list[float]],
+        cache: ResponseCache | None = None,
+        threshold: float = 0.02,
+        max_entries_per_scope: int = 1024,
+    ):
+        self.embed_fn = embed_fn
+        self.cache = cache or InMemoryLRUResponseCache()
+        self.threshold = threshold
+        self.max_entries_per_scope = max_entries_per_scope
+        # Prompt vectors and keys per scope, by key digest in insertion order
+        self._index: dict[str, dict[str, tuple[list[float], ResponseCacheKey]]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _cosine_distance(a: list[float], b: list[float]) -> float:
+        dot = sum(x * y for x, y in zip(a, b, strict=False))
+        norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+        if not norm:
+            return 1.0
+        return 1.0 - dot / norm
+
+    def get(self, key: ResponseCacheKey) -> AIModelCallResponse | None:
+        response = self.cache.get(key)
+        if response is not None or not key.query:
+            return response
+
+        with self._lock:
+            candidates = list(self._index.get(key.scope, {}).values())
+        if not candidates:
+            return None
+
+        query_vector = self.embed_fn(key.query)
+        distance, matched_key = min(
+            ((self._cosine_distance(query_vector, vector), cached_key) for vector, cached_key in candidates),
+            key=lambda item: item[0],
+        )
+        if distance > self.threshold:
+            return None
+
+        return self.cache.get(matched_key)
+
+    def put(self, key: ResponseCacheKey, response: AIModelCallResponse, ttl: float | None = None) -> None:
+        self.cache.put(key, response, ttl=ttl)
+        if not key.query:
+            return
+
+        with self._lock:
+            if key.digest in self._index.get(key.scope, {}):
+                # Already indexed, and the prompt of a digest doesn't change
+                return
+
+        vector = self.embed_fn(key.query)
+        with self._lock:
+            entries = self._index.setdefault(key.scope, {})
+            entries[key.digest] = (vector, key)
+            if len(entries) > self.max_entries_per_scope:
+                del entries[next(iter(entries))]
@@ -0,0 +1,2 @@
+# ruff: noqa: F401
+from .fanout import run_many
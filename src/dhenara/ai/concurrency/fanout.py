@@ -0,0 +1,60 @@
+import asyncio
+import logging
+
+from dhenara.ai.ai_client import AIModelClient
+from dhenara.ai.types import AIModelCallResponse
+from dhenara.ai.types.genai.dhenara.request import Prompt, SystemInstruction
+
+logger = logging.getLogger(__name__)
+
+
+async def run_many(
+    client: AIModelClient,
+    prompts: list[str | dict | Prompt],
+    context: list[str | dict | Prompt] | None = None,
+    instructions: list[str | dict | SystemInstruction] | None = None,
+    concurrency: int = 16,
+    return_exceptions: bool = False,
+) -> list[AIModelCallResponse | BaseException]:
+    """
+    Generate responses for independent prompts concurrently over a single connection.
+
+    The client connection is opened once and shared by all requests, with at most `concurrency`
+    requests in flight at a time. Each prompt is sent with the same `context` and `instructions`.
+
+    Args:
+        client: An async, non-streaming AIModelClient
+        prompts: Independent prompts to generate responses for
+        context: Optional conversation context, shared by all prompts
+        instructions: Optional system instructions, shared by all prompts
+        concurrency: Maximum number of in-flight requests
+        return_exceptions: Return exceptions in place of responses instead of raising the first one
+
+    Returns:
+        Responses in the same order as `prompts`
+    """
+    if not client.is_async:
+        raise ValueError("run_many: client should be created with is_async=True")
+    if client.config.streaming:
+        raise ValueError("run_many: streaming is not supported, as streams are tracked per provider client")
+    if concurrency < 1:
+        raise ValueError(f"run_many: concurrency should be at least 1, got {concurrency}")
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _generate(prompt):
+        async with semaphore:
+            return await client.generate_with_existing_connection_async(
+                prompt=prompt,
+                context=context,
+                instructions=instructions,
+            )
+
+    async with client:
+        tasks = [asyncio.create_task(_generate(prompt)) for prompt in prompts]
+        try:
+            return await asyncio.gather(*tasks, return_exceptions=return_exceptions)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
@@ -0,0 +1,2 @@
+# ruff: noqa: F401
+from .endpoint_pool import EndpointPool, EndpointState, is_endpoint_failure
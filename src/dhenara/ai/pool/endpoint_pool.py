@@ -0,0 +1,209 @@
+import asyncio
+import logging
+import random
+import time
+from dataclasses import dataclass
+
+from dhenara.ai.ai_client import AIModelClient
+from dhenara.ai.types import (
+    AIModelCallConfig,
+    AIModelCallResponse,
+    AIModelEndpoint,
+    ExternalApiCallStatusEnum,
+)
+from dhenara.ai.types.genai.dhenara.request import Prompt, SystemInstruction
+
+logger = logging.getLogger(__name__)
+
+# HTTP status codes of API errors down to the endpoint rather than the request, besides server errors
+_ENDPOINT_ERROR_HTTP_STATUS_CODES = (408, 429)
+
+
+def is_endpoint_failure(response: AIModelCallResponse | None) -> bool:
+    """
+    Whether a response failed because of the endpoint, ie. a transport error, a timeout, a server error or a
+    rate limit. Requests that failed validation or were rejected by the API fail the same on any endpoint.
+    """
+    if response is None or response.status is None:
+        return True
+
+    status = response.status
+    if status.status in (ExternalApiCallStatusEnum.REQUEST_SEND, ExternalApiCallStatusEnum.RESPONSE_TIMEOUT):
+        return True
+    if status.status == ExternalApiCallStatusEnum.RESPONSE_RECEIVED_API_ERROR:
+        http_status_code = status.http_status_code or 0
+        return http_status_code >= 500 or http_status_code in _ENDPOINT_ERROR_HTTP_STATUS_CODES
+    return False
+
+
+@dataclass
+class EndpointState:
+    """Load and health of an endpoint in an EndpointPool"""
+
+    endpoint: AIModelEndpoint
+    limit: int
+    in_flight: int = 0
+    cooldown_until: float = 0.0
+
+    @property
+    def healthy(self) -> bool:
+        return self.cooldown_until <= time.monotonic()
+
+    @property
+    def saturated(self) -> bool:
+        return self.in_flight >= self.limit
+
+    @property
+    def load(self) -> float:
+        return self.in_flight / self.limit
+
+
+class EndpointPool:
+    """
+    Spreads requests across interchangeable model endpoints.
+
+    Each endpoint has a limit of in-flight requests. Requests go to the least loaded healthy endpoint,
+    and wait when all of them are at their limit. An endpoint that fails a request with a transport error,
+    a timeout, a server error or a rate limit is put on cooldown, and the request is retried on another endpoint.
+    Other failures, like input validation errors, are returned as they are without failing over.
+
+    Args:
+        endpoints: Endpoints to spread requests across
+        concurrency_limit: Default limit of in-flight requests per endpoint
+        limits: Limits by model name, overriding `concurrency_limit`
+        cooldown: Seconds an endpoint is skipped after a failure
+    """
+
+    def __init__(
+        self,
+        endpoints: list[AIModelEndpoint],
+        concurrency_limit: int = 8,
+        limits: dict[str, int] | None = None,
+        cooldown: float = 30.0,
+    ):
+        if not endpoints:
+            raise ValueError("EndpointPool: endpoints should not be empty")
+
+        limits = limits or {}
+        self.states = [
+            EndpointState(
+                endpoint=endpoint,
+                limit=limits.get(endpoint.ai_model.model_name, concurrency_limit),
+            )
+            for endpoint in endpoints
+        ]
+        for state in self.states:
+            if state.limit < 1:
+                raise ValueError(f"EndpointPool: limit of {state.endpoint.ai_model.model_name} should be at least 1")
+
+        self.cooldown = cooldown
+        self._condition: asyncio.Condition | None = None
+        self._condition_loop: asyncio.AbstractEventLoop | None = None
+
+    def _get_condition(self) -> asyncio.Condition:
+        # A condition is bound to the loop it is first used in, so use one per running loop.
+        # This lets a pool created at module level be used across `asyncio.run()` calls
+        loop = asyncio.get_running_loop()
+        if self._condition is None or self._condition_loop is not loop:
+            self._condition = asyncio.Condition()
+            self._condition_loop = loop
+        return self._condition
+
+    def _get_state(self, endpoint: AIModelEndpoint) -> EndpointState:
+        for state in self.states:
+            if state.endpoint == endpoint:
+                return state
+        raise ValueError(f"EndpointPool: {endpoint.ai_model.model_name} is not in the pool")
+
+    def _get_candidates(
+        self,
+        prefer_provider: str | None = None,
+        exclude: list[EndpointState] | None = None,
+    ) -> list[EndpointState]:
+        states = [state for state in self.states if not exclude or state not in exclude]
+        # Fall back to endpoints on cooldown, rather than failing when none is healthy
+        states = [state for state in states if state.healthy] or states
+        if prefer_provider:
+            states = [state for state in states if state.endpoint.api.provider == prefer_provider] or states
+        return states
+
+    def random_healthy(self, prefer_provider: str | None = None) -> AIModelEndpoint:
+        """Returns a random healthy endpoint, of `prefer_provider` if there is one"""
+        return random.choice(self._get_candidates(prefer_provider)).endpoint
+
+    def mark_failed(self, endpoint: AIModelEndpoint) -> None:
+        """Put an endpoint on cooldown, eg: after a rate limit or server error outside the pool"""
+        state = self._get_state(endpoint)
+        state.cooldown_until = time.monotonic() + self.cooldown
+        logger.warning(f"EndpointPool: {endpoint.ai_model.model_name} on cooldown for {self.cooldown}s")
+
+    async def acquire(
+        self,
+        prefer_provider: str | None = None,
+        exclude: list[EndpointState] | None = None,
+    ) -> EndpointState:
+        """Reserve a slot on the least loaded healthy endpoint, waiting while all are at their limit"""
+        condition = self._get_condition()
+        async with condition:
+            while True:
+                candidates = [
+                    state for state in self._get_candidates(prefer_provider, exclude=exclude) if not state.saturated
+                ]
+                if candidates:
+                    state = min(candidates, key=lambda s: s.load)
+                    state.in_flight += 1
+                    return state
+                await condition.wait()
+
+    async def release(self, state: EndpointState, failed: bool = False) -> None:
+        """Release a slot reserved by `acquire()`"""
+        if failed:
+            self.mark_failed(state.endpoint)
+        condition = self._get_condition()
+        async with condition:
+            state.in_flight -= 1
+            condition.notify_all()
+
+    async def generate(
+        self,
+        prompt: str | dict | Prompt,
+        context: list[str | dict | Prompt] | None = None,
+        instructions: list[str | dict | SystemInstruction] | None = None,
+        config: AIModelCallConfig | None = None,
+        prefer_provider: str | None = None,
+    ) -> AIModelCallResponse | None:
+        """
+        Generate a response on a pooled endpoint, failing over to the other endpoints on errors.
+
+        Only endpoint failures (see `is_endpoint_failure()`) fail over. Other failed responses are returned, and
+        exceptions other than timeouts are raised, without putting the endpoint on cooldown.
+        Returns the last failed response (or None) when all endpoints fail. Streaming is not supported.
+        """
+        if config is not None and config.streaming:
+            raise ValueError("EndpointPool: streaming is not supported")
+
+        tried: list[EndpointState] = []
+        response = None
+        while len(tried) < len(self.states):
+            state = await self.acquire(prefer_provider=prefer_provider, exclude=tried)
+            tried.append(state)
+
+            failed = False
+            try:
+                client = AIModelClient(model_endpoint=state.endpoint, config=config, is_async=True)
+                response = await client.generate_async(
+                    prompt=prompt,
+                    context=context,
+                    instructions=instructions,
+                )
+                failed = is_endpoint_failure(response)
+            except asyncio.TimeoutError as e:
+                logger.error(f"EndpointPool: {state.endpoint.ai_model.model_name} timed out: {e}")
+                failed = True
+            finally:
+                await self.release(state, failed=failed)
+
+            if not failed:
+                return response
+
+        return response
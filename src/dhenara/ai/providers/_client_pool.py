@@ -0,0 +1,156 @@
+"""
+Process wide pool of provider SDK clients.
+
+SDK clients own a keep-alive HTTP connection pool, so reusing a client across calls avoids a new
+TCP+TLS handshake on every call. Sync clients are shared across threads. Async clients are bound to
+the event loop they were created in, so they are pooled per running loop. They are closed when the loop
+shuts down its async generators (as `asyncio.run` does), and evicted once the loop is found closed.
+"""
+
+import asyncio
+import atexit
+import inspect
+import json
+import logging
+import threading
+from collections.abc import AsyncGenerator, Callable, Hashable
+from typing import Any
+
+from dhenara.ai.types.genai.ai_model import AIModelAPI
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+_sync_clients: dict[Hashable, Any] = {}
+_async_clients: dict[asyncio.AbstractEventLoop, dict[Hashable, Any]] = {}
+# Per loop async generators closing the loop's clients when the loop shuts down its async generators
+_loop_shutdown_hooks: dict[asyncio.AbstractEventLoop, AsyncGenerator[None, None]] = {}
+
+
+def get_client_pool_key(client_type: str, api: AIModelAPI, **kwargs) -> Hashable:
+    """Returns a hashable key identifying an API and its client params"""
+    return (
+        client_type,
+        api.provider,
+        api.api_key,
+        json.dumps(api.credentials, sort_keys=True, default=str),
+        json.dumps(api.config, sort_keys=True, default=str),
+        json.dumps(kwargs, sort_keys=True, default=str),
+    )
+
+
+def _close_client(client: Any) -> None:
+    close = getattr(client, "close", None)
+    if close is None:
+        return
+    try:
+        close()
+    except Exception as e:
+        logger.debug(f"client_pool: Error closing client: {e}")
+
+
+def get_sync_client(key: Hashable, factory: Callable[[], Any]) -> Any:
+    """Returns the pooled sync client for the key, creating it with `factory` on first use"""
+    with _lock:
+        client = _sync_clients.get(key)
+    if client is not None:
+        return client
+
+    # Create the client outside the lock, as it may block on loading credentials
+    new_client = factory()
+    with _lock:
+        client = _sync_clients.setdefault(key, new_client)
+
+    if client is not new_client:
+        # Another thread created one meanwhile
+        _close_client(new_client)
+    return client
+
+
+async def _aclose_client(client: Any) -> None:
+    close = getattr(client, "aclose", None) or getattr(client, "close", None)
+    if close is None:
+        return
+    try:
+        result = close()
+        if inspect.isawaitable(result):
+            await result
+    except Exception as e:
+        logger.debug(f"client_pool: Error closing async client: {e}")
+
+
+def _is_client_closed(client: Any) -> bool:
+    is_closed = getattr(client, "is_closed", None)
+    return callable(is_closed) and is_closed() is True
+
+
+async def _close_loop_clients_on_shutdown(loop: asyncio.AbstractEventLoop) -> AsyncGenerator[None, None]:
+    """Suspends until the loop finalizes its async generators, then closes the loop's pooled clients"""
+    try:
+        yield
+    finally:
+        with _lock:
+            loop_clients = _async_clients.pop(loop, {})
+            _loop_shutdown_hooks.pop(loop, None)
+
+        for client in loop_clients.values():
+            await _aclose_client(client)
+
+
+def _evict_closed_loops() -> None:
+    """Drops clients of loops closed without shutting down their async generators"""
+    with _lock:
+        closed_loops = [loop for loop in _async_clients if loop.is_closed()]
+        hooks = [_loop_shutdown_hooks.pop(loop, None) for loop in closed_loops]
+        for loop in closed_loops:
+            del _async_clients[loop]
+
+    for hook in hooks:
+        if hook is None:
+            continue
+        # The loop clients are already dropped, so the hook finishes without awaiting on the closed loop
+        try:
+            hook.aclose().send(None)
+        except (StopIteration, RuntimeError):
+            pass
+
+
+async def get_async_client(key: Hashable, factory: Callable[[], Any]) -> Any:
+    """Returns the pooled async client for the key in the running event loop"""
+    loop = asyncio.get_running_loop()
+    _evict_closed_loops()
+
+    with _lock:
+        loop_clients = _async_clients.get(loop, {})
+        client = loop_clients.get(key)
+        if client is not None and _is_client_closed(client):
+            # Closed by the caller, eg. on exiting an `async with client` block
+            del loop_clients[key]
+            client = None
+    if client is not None:
+        return client
+
+    # Create the client outside the lock, as it may block on loading credentials.
+    # Async clients are created on the loop thread, so another one can't be added to this loop meanwhile
+    new_client = factory()
+    with _lock:
+        loop_clients = _async_clients.setdefault(loop, {})
+        client = loop_clients.setdefault(key, new_client)
+        hook = None
+        if loop not in _loop_shutdown_hooks:
+            hook = _loop_shutdown_hooks[loop] = _close_loop_clients_on_shutdown(loop)
+
+    if hook is not None:
+        # Starting the generator registers it with the loop, which finalizes it on `shutdown_asyncgens()`
+        await hook.asend(None)
+    return client
+
+
+@atexit.register
+def close_sync_clients() -> None:
+    with _lock:
+        clients = list(_sync_clients.values())
+        _sync_clients.clear()
+
+    for client in clients:
+        _close_client(client)
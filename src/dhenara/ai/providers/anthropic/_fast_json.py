@@ -0,0 +1,53 @@
+"""
+Anthropic clients encoding request bodies with orjson.
+
+The SDK encodes request bodies with the stdlib json module, which dominates the send path for long
+multi-turn message lists. When orjson is installed (`pip install dhenara-ai[fast-json]`), plain JSON
+bodies are encoded with it instead. Bodies orjson can't encode are left to the SDK.
+"""
+
+import logging
+
+from anthropic import Anthropic, AsyncAnthropic
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+
+class _ORJSONRequestMixin:
+    def _build_request(self, options, *, retries_taken: int = 0):
+        json_data = options.json_data
+        if (
+            isinstance(json_data, dict)
+            and options.content is None
+            and options.files is None
+            and options.extra_json is None
+            and options.method.lower() != "get"
+        ):
+            try:
+                content = orjson.dumps(json_data)
+            except TypeError as e:
+                logger.debug("anthropic: Falling back to SDK encoding of request body: %s", e)
+            else:
+                options = options.model_copy(update={"content": content, "json_data": None})
+
+        return super()._build_request(options, retries_taken=retries_taken)
+
+
+class ORJSONAnthropic(_ORJSONRequestMixin, Anthropic):
+    pass
+
+
+class ORJSONAsyncAnthropic(_ORJSONRequestMixin, AsyncAnthropic):
+    pass
+
+
+def get_anthropic_client_classes() -> tuple[type[Anthropic], type[AsyncAnthropic]]:
+    """Returns the sync and async Anthropic client classes, using orjson when it is installed"""
+    if orjson is None:
+        return Anthropic, AsyncAnthropic
+    return ORJSONAnthropic, ORJSONAsyncAnthropic
@@ -9,10 +9,12 @@ from anthropic import (
     AsyncAnthropicVertex,
 )
 
+from dhenara.ai.providers._client_pool import get_async_client, get_client_pool_key, get_sync_client
 from dhenara.ai.providers.base import AIModelProviderClientBase
 from dhenara.ai.providers.shared import APIProviderSharedFns
 from dhenara.ai.types.genai.ai_model import AIModelAPIProviderEnum
 
+from ._fast_json import get_anthropic_client_classes
 from .formatter import AnthropicFormatter
 
 logger = logging.getLogger(__name__)
@@ -62,24 +64,36 @@ class AnthropicClientBase(AIModelProviderClientBase):
         logger.error(error_msg)
         raise ValueError(error_msg)
 
-    def _setup_client_sync(self) -> Anthropic | AnthropicBedrock | AnthropicVertex:
-        """Get the appropriate sync Anthropic client based on the provider"""
+    def _get_pool_key(self):
+        api = self.model_endpoint.api
+        return get_client_pool_key("anthropic", api, **self._get_client_http_params(api))
+
+    def _create_client_sync(self) -> Anthropic | AnthropicBedrock | AnthropicVertex:
         client_type, params = self._get_client_params(self.model_endpoint.api)
 
         if client_type == "anthropic":
-            return Anthropic(**params)
+            anthropic_class, _ = get_anthropic_client_classes()
+            return anthropic_class(**params)
         elif client_type == "vertex_ai":
             return AnthropicVertex(**params)
         else:  # bedrock
             return AnthropicBedrock(**params)
 
-    async def _setup_client_async(self) -> AsyncAnthropic | AsyncAnthropicBedrock | AsyncAnthropicVertex:
-        """Get the appropriate async Anthropic client based on the provider"""
+    def _create_client_async(self) -> AsyncAnthropic | AsyncAnthropicBedrock | AsyncAnthropicVertex:
         client_type, params = self._get_client_params(self.model_endpoint.api)
 
         if client_type == "anthropic":
-            return AsyncAnthropic(**params)
+            _, async_anthropic_class = get_anthropic_client_classes()
+            return async_anthropic_class(**params)
         elif client_type == "vertex_ai":
             return AsyncAnthropicVertex(**params)
         else:  # bedrock
             return AsyncAnthropicBedrock(**params)
+
+    def _setup_client_sync(self) -> Anthropic | AnthropicBedrock | AnthropicVertex:
+        """Get the appropriate sync Anthropic client based on the provider, reusing pooled connections"""
+        return get_sync_client(self._get_pool_key(), self._create_client_sync)
+
+    async def _setup_client_async(self) -> AsyncAnthropic | AsyncAnthropicBedrock | AsyncAnthropicVertex:
+        """Get the appropriate async Anthropic client based on the provider, reusing pooled connections"""
+        return await get_async_client(self._get_pool_key(), self._create_client_async)
@@ -1,4 +1,5 @@
 import logging
+import time
 
 from anthropic.types import (
     ContentBlock,
@@ -9,7 +10,6 @@ from anthropic.types import (
     RawContentBlockStopEvent,
     RawMessageDeltaEvent,
     RawMessageStartEvent,
-    RawMessageStopEvent,
     RedactedThinkingBlock,
     SignatureDelta,
     TextBlock,
@@ -46,6 +46,16 @@ logger = logging.getLogger(__name__)
 
 # -----------------------------------------------------------------------------
 class AnthropicChat(AnthropicClientBase):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._reset_text_delta_buffers()
+
+    def _reset_text_delta_buffers(self) -> None:
+        # Text deltas buffered per content index, when `stream_flush_chars` is set
+        self._text_delta_buffers: dict[int, list[str]] = {}
+        self._text_delta_buffered_chars = 0
+        self._text_delta_last_flush = time.monotonic()
+
     def get_api_call_params(
         self,
         prompt: dict,
@@ -71,9 +81,14 @@ class AnthropicChat(AnthropicClientBase):
                 )
             system_prompt = instructions["content"]  # Extract text from system prompt
 
+        cache_control = self._get_cache_control()
+
         # Add previous messages and current prompt
         if context:
             messages.extend(context)
+            if cache_control:
+                # Mark the end of history as a cache breakpoint, so that the whole prefix is reused on next turn
+                messages[-1] = self._with_cache_control(messages[-1], cache_control)
 
         messages.append(prompt)
 
@@ -85,7 +100,16 @@ class AnthropicChat(AnthropicClientBase):
         }
 
         if system_prompt:
-            chat_args["system"] = system_prompt
+            if cache_control:
+                chat_args["system"] = [
+                    {
+                        "type": "text",
+                        "text": system_prompt,
+                        "cache_control": cache_control,
+                    }
+                ]
+            else:
+                chat_args["system"] = system_prompt
 
         if user:
             chat_args["metadata"] = {"user_id": user}
@@ -145,6 +169,31 @@ class AnthropicChat(AnthropicClientBase):
 
         return {"chat_args": chat_args}
 
+    def _get_cache_control(self) -> dict | None:
+        """Returns the `cache_control` marker for prompt caching, or None when caching is disabled"""
+        if not self.config.enable_prompt_cache:
+            return None
+
+        cache_control = {"type": "ephemeral"}
+        if self.config.cache_ttl:
+            cache_control["ttl"] = self.config.cache_ttl
+
+        return cache_control
+
+    @staticmethod
+    def _with_cache_control(message: dict, cache_control: dict) -> dict:
+        """Returns a copy of the message with `cache_control` set on its last content block"""
+        content = message.get("content")
+        if isinstance(content, str):
+            blocks = [{"type": "text", "text": content}]
+        elif isinstance(content, list) and content:
+            blocks = list(content)
+        else:
+            return message
+
+        blocks[-1] = {**blocks[-1], "cache_control": cache_control}
+        return {**message, "content": blocks}
+
     def do_api_call_sync(
         self,
         api_call_params: dict,
@@ -183,120 +232,168 @@ class AnthropicChat(AnthropicClientBase):
     ) -> StreamingChatResponse | SSEErrorResponse | None:
         """Handle streaming response with progress tracking and final response"""
 
-        processed_chunks = []
+        # Events carry a `type` discriminator, so dispatch on it instead of an isinstance chain per chunk
+        handler = self._stream_chunk_handlers.get(chunk.type)
+        if handler is None:
+            logger.debug("anthropic: Unhandled message type %s", chunk.type)
+            return []
+
+        return handler(self, chunk)
 
-        # self.streaming_manager.message_metadata  is used to preserve params of initial message across chunks
-        if isinstance(chunk, RawMessageStartEvent):
-            message = chunk.message
+    # -------------------------------------------------------------------------
+    # Stream chunk handlers
+    # self.streaming_manager.message_metadata  is used to preserve params of initial message across chunks
+    def _on_message_start(self, chunk: RawMessageStartEvent) -> list[StreamingChatResponse]:
+        message = chunk.message
+        self._reset_text_delta_buffers()
 
-            # Initialize message metadata
-            self.streaming_manager.message_metadata = {
+        # Initialize message metadata
+        self.streaming_manager.message_metadata.update(
+            {
                 "id": message.id,
                 "model": message.model,
                 "role": message.role,
                 "type": type,
                 "index": 0,  # Only one choice from Antropic
             }
+        )
 
-            # Anthropic has a wieded way of reporint usage on streaming
-            # On message_start, usage will have input tokens and few output tokens
-            _usage = chunk.message.usage
-            if _usage:
-                # Initialize usage in self.streaming_manager
-                usage = ChatResponseUsage(
-                    total_tokens=0,
-                    prompt_tokens=_usage.input_tokens,
-                    completion_tokens=_usage.output_tokens,
-                )
-                self.streaming_manager.update_usage(usage)
-
-        elif isinstance(chunk, RawContentBlockStartEvent):
-            block_type = chunk.content_block.type
-            if block_type == "redacted_thinking":
-                content_deltas = [
-                    ChatResponseReasoningContentItem(
-                        index=chunk.index,
-                        role=self.streaming_manager.message_metadata["role"],
-                        metadata={
-                            "redacted_thinking_data": chunk.content_block.data,
-                        },
-                    )
-                ]
-
-                choice_deltas = [
-                    ChatResponseChoiceDelta(
-                        index=self.streaming_manager.message_metadata["index"],
-                        content_deltas=content_deltas,
-                        metadata={},
-                    )
-                ]
+        # Anthropic has a wieded way of reporint usage on streaming
+        # On message_start, usage will have input tokens and few output tokens
+        _usage = chunk.message.usage
+        if _usage:
+            # Initialize usage in self.streaming_manager
+            usage = ChatResponseUsage(
+                total_tokens=0,
+                prompt_tokens=_usage.input_tokens,
+                completion_tokens=_usage.output_tokens,
+            )
+            self.streaming_manager.update_usage(usage)
 
-                response_chunk = self.streaming_manager.update(choice_deltas=choice_deltas)
-                stream_response = StreamingChatResponse(
-                    id=self.streaming_manager.message_metadata["id"],
-                    data=response_chunk,
-                )
+        return []
 
-                processed_chunks.append(stream_response)
-            elif block_type in ["text", "thinking"]:
-                pass
-            else:
-                logger.debug(f"anthropic: Unhandled content_block_type {block_type}")
-
-        elif isinstance(chunk, RawContentBlockDeltaEvent):
-            content_deltas = [
-                self.process_content_item_delta(
-                    index=chunk.index,
-                    role=self.streaming_manager.message_metadata["role"],
-                    delta=chunk.delta,
-                )
-            ]
+    def _get_content_delta_response(self, content_delta) -> StreamingChatResponse:
+        # Called for every streamed token, so look up the manager and metadata once
+        streaming_manager = self.streaming_manager
+        message_metadata = streaming_manager.message_metadata
 
-            choice_deltas = [
-                ChatResponseChoiceDelta(
-                    index=self.streaming_manager.message_metadata["index"],
-                    content_deltas=content_deltas,
-                    metadata={},
-                )
-            ]
-            response_chunk = self.streaming_manager.update(choice_deltas=choice_deltas)
-            stream_response = StreamingChatResponse(
-                id=self.streaming_manager.message_metadata["id"],
-                data=response_chunk,
-            )
-            processed_chunks.append(stream_response)
-        elif isinstance(chunk, RawContentBlockStopEvent):
-            pass
-        elif isinstance(chunk, RawMessageDeltaEvent):
-            # Update output tokens
-            self.streaming_manager.usage.completion_tokens += chunk.usage.output_tokens
-            self.streaming_manager.usage.total_tokens = (
-                self.streaming_manager.usage.prompt_tokens + self.streaming_manager.usage.completion_tokens
+        choice_deltas = [
+            ChatResponseChoiceDelta(
+                index=message_metadata["index"],
+                content_deltas=[content_delta],
+                metadata={},
             )
+        ]
+        response_chunk = streaming_manager.update(choice_deltas=choice_deltas)
+        return StreamingChatResponse.make(
+            id=message_metadata["id"],
+            data=response_chunk,
+        )
 
-            # Update choice metatdata
-            choice_deltas = [
-                ChatResponseChoiceDelta(
-                    index=self.streaming_manager.message_metadata["index"],
-                    finish_reason=chunk.delta.stop_reason,
-                    stop_sequence=chunk.delta.stop_sequence,
-                    content_deltas=[],
-                    metadata={},
+    def _buffer_text_delta(self, index: int, text: str, flush_chars: int) -> list[StreamingChatResponse]:
+        self._text_delta_buffers.setdefault(index, []).append(text)
+        self._text_delta_buffered_chars += len(text)
+
+        flush_interval = self.config.stream_flush_interval
+        if self._text_delta_buffered_chars >= flush_chars or (
+            flush_interval is not None and time.monotonic() - self._text_delta_last_flush >= flush_interval
+        ):
+            return self._flush_text_deltas()
+        return []
+
+    def _flush_text_deltas(self) -> list[StreamingChatResponse]:
+        """Send the buffered text deltas, one delta per content index"""
+        if not self._text_delta_buffers:
+            return []
+
+        role = self.streaming_manager.message_metadata["role"]
+        responses = [
+            self._get_content_delta_response(
+                ChatResponseTextContentItemDelta(
+                    index=index,
+                    role=role,
+                    text_delta="".join(buffer),
                 )
-            ]
-            response_chunk = self.streaming_manager.update(choice_deltas=choice_deltas)
-            stream_response = StreamingChatResponse(
-                id=self.streaming_manager.message_metadata["id"],
-                data=response_chunk,
             )
-            processed_chunks.append(stream_response)
-
-        elif isinstance(chunk, RawMessageStopEvent):
+            for index, buffer in self._text_delta_buffers.items()
+        ]
+        self._reset_text_delta_buffers()
+        return responses
+
+    def _on_content_block_start(self, chunk: RawContentBlockStartEvent) -> list[StreamingChatResponse]:
+        block_type = chunk.content_block.type
+        if block_type == "redacted_thinking":
+            content_delta = ChatResponseReasoningContentItem(
+                index=chunk.index,
+                role=self.streaming_manager.message_metadata["role"],
+                metadata={
+                    "redacted_thinking_data": chunk.content_block.data,
+                },
+            )
+            return [*self._flush_text_deltas(), self._get_content_delta_response(content_delta)]
+        elif block_type in ["text", "thinking"]:
             pass
         else:
-            logger.debug(f"anthropic: Unhandled message type {chunk.type}")
+            logger.debug("anthropic: Unhandled content_block_type %s", block_type)
+
+        return []
+
+    def _on_content_block_delta(self, chunk: RawContentBlockDeltaEvent) -> list[StreamingChatResponse]:
+        delta = chunk.delta
+        flush_chars = self.config.stream_flush_chars
+        if flush_chars and isinstance(delta, TextDelta):
+            return self._buffer_text_delta(chunk.index, delta.text, flush_chars)
+
+        # Flush the buffered text first, so the streaming manager records the deltas in the order they came
+        flushed = self._flush_text_deltas()
+        content_delta = self.process_content_item_delta(
+            index=chunk.index,
+            role=self.streaming_manager.message_metadata["role"],
+            delta=delta,
+        )
+        return [*flushed, self._get_content_delta_response(content_delta)]
+
+    def _on_content_block_stop(self, chunk: RawContentBlockStopEvent) -> list[StreamingChatResponse]:
+        return self._flush_text_deltas()
+
+    def _on_message_delta(self, chunk: RawMessageDeltaEvent) -> list[StreamingChatResponse]:
+        flushed = self._flush_text_deltas()
+        streaming_manager = self.streaming_manager
+        message_metadata = streaming_manager.message_metadata
+
+        # Update output tokens
+        usage = streaming_manager.usage
+        usage.completion_tokens += chunk.usage.output_tokens
+        usage.total_tokens = usage.prompt_tokens + usage.completion_tokens
+
+        # Update choice metatdata
+        choice_deltas = [
+            ChatResponseChoiceDelta(
+                index=message_metadata["index"],
+                finish_reason=chunk.delta.stop_reason,
+                stop_sequence=chunk.delta.stop_sequence,
+                content_deltas=[],
+                metadata={},
+            )
+        ]
+        response_chunk = streaming_manager.update(choice_deltas=choice_deltas)
+        stream_response = StreamingChatResponse.make(
+            id=message_metadata["id"],
+            data=response_chunk,
+        )
+        return [*flushed, stream_response]
+
+    def _on_noop_chunk(self, chunk: MessageStreamEvent) -> list[StreamingChatResponse]:
+        return []
 
-        return processed_chunks
+    _stream_chunk_handlers = {
+        "message_start": _on_message_start,
+        "content_block_start": _on_content_block_start,
+        "content_block_delta": _on_content_block_delta,
+        "content_block_stop": _on_content_block_stop,
+        "message_delta": _on_message_delta,
+        "message_stop": _on_noop_chunk,
+    }
 
     # API has stopped streaming, get final response
 
@@ -345,80 +442,32 @@ class AnthropicChat(AnthropicClientBase):
             ),
         )
 
+    @staticmethod
+    def _get_handler(handlers: dict, item):
+        """Find the handler by exact type, falling back to the MRO for subclasses"""
+        handler = handlers.get(type(item))
+        if handler is None:
+            for item_type in type(item).__mro__[1:]:
+                handler = handlers.get(item_type)
+                if handler is not None:
+                    break
+        return handler
+
     def process_content_item(
         self,
         index: int,
         role: str,
         content_item: ContentBlock,
     ) -> ChatResponseContentItem:
-        if isinstance(content_item, TextBlock):
-            return ChatResponseTextContentItem(
-                index=index,
-                role=role,
-                text=content_item.text,
-            )
-        elif isinstance(content_item, ThinkingBlock):
-            return ChatResponseReasoningContentItem(
-                index=index,
-                role=role,
-                thinking_text=content_item.thinking,
-                metadata={
-                    "signature": content_item.signature,
-                },
-            )
-
-        elif isinstance(content_item, RedactedThinkingBlock):
-            return ChatResponseReasoningContentItem(
-                index=index,
-                role=role,
-                metadata={
-                    "redacted_thinking_data": content_item.data,
-                },
-            )
-
-        elif isinstance(content_item, ToolUseBlock):
-            raw_response = content_item.model_dump()
-            try:
-                tool_call = ChatResponseToolCall.from_anthropic_format(raw_response)
-            except Exception as e:
-                logger.exception(f"Error parsing tool call: {e}")
-                tool_call = None
-
-            # For anthropic, structed output reqs are send as tool_call
-            if self.config.structured_output is not None:
-                structured_output = ChatResponseStructuredOutput.from_tool_call(
-                    raw_response=raw_response,
-                    tool_call=tool_call,
-                    config=self.config.structured_output,
-                )
-                return ChatResponseStructuredOutputContentItem(
-                    index=index,
-                    role=role,
-                    structured_output=structured_output,
-                )
-            else:
-                if tool_call:
-                    return ChatResponseToolCallContentItem(
-                        index=index,
-                        role=role,
-                        tool_call=tool_call,
-                        metadata={},
-                    )
-                else:
-                    return self.get_unknown_content_type_item(
-                        index=index,
-                        role=role,
-                        unknown_item=content_item,
-                        streaming=False,
-                    )
-
-        else:
+        handler = self._get_handler(self._content_item_handlers, content_item)
+        if handler is None:
             return self.get_unknown_content_type_item(
                 index=index,
                 role=role,
                 unknown_item=content_item,
                 streaming=False,
             )
+        return handler(self, index, role, content_item)
 
     def process_content_item_delta(
         self,
@@ -426,33 +475,122 @@ class AnthropicChat(AnthropicClientBase):
         role: str,
         delta,
     ) -> ChatResponseContentItemDelta:
-        if isinstance(delta, TextDelta):
-            return ChatResponseTextContentItemDelta(
+        handler = self._get_handler(self._content_item_delta_handlers, delta)
+        # TODO: Tools Not supported in streaming yet
+        if handler is None:
+            return self.get_unknown_content_type_item(
                 index=index,
                 role=role,
-                text_delta=delta.text,
+                unknown_item=delta,
+                streaming=True,
             )
-        elif isinstance(delta, ThinkingDelta):
-            return ChatResponseReasoningContentItemDelta(
-                index=index,
-                role=role,
-                thinking_text_delta=delta.thinking,
-                metadata={},
+        return handler(self, index, role, delta)
+
+    # -------------------------------------------------------------------------
+    # Content item handlers
+    def _process_text_block(self, index: int, role: str, content_item: TextBlock) -> ChatResponseContentItem:
+        return ChatResponseTextContentItem(
+            index=index,
+            role=role,
+            text=content_item.text,
+        )
+
+    def _process_thinking_block(self, index: int, role: str, content_item: ThinkingBlock) -> ChatResponseContentItem:
+        return ChatResponseReasoningContentItem(
+            index=index,
+            role=role,
+            thinking_text=content_item.thinking,
+            metadata={
+                "signature": content_item.signature,
+            },
+        )
+
+    def _process_redacted_thinking_block(
+        self,
+        index: int,
+        role: str,
+        content_item: RedactedThinkingBlock,
+    ) -> ChatResponseContentItem:
+        return ChatResponseReasoningContentItem(
+            index=index,
+            role=role,
+            metadata={
+                "redacted_thinking_data": content_item.data,
+            },
+        )
+
+    def _process_tool_use_block(self, index: int, role: str, content_item: ToolUseBlock) -> ChatResponseContentItem:
+        raw_response = content_item.model_dump()
+        try:
+            tool_call = ChatResponseToolCall.from_anthropic_format(raw_response)
+        except Exception as e:
+            logger.exception(f"Error parsing tool call: {e}")
+            tool_call = None
+
+        # For anthropic, structed output reqs are send as tool_call
+        if self.config.structured_output is not None:
+            structured_output = ChatResponseStructuredOutput.from_tool_call(
+                raw_response=raw_response,
+                tool_call=tool_call,
+                config=self.config.structured_output,
             )
-        elif isinstance(delta, SignatureDelta):
-            return ChatResponseReasoningContentItemDelta(
+            return ChatResponseStructuredOutputContentItem(
                 index=index,
                 role=role,
-                thinking_text_delta="",
-                metadata={
-                    "signature": delta.signature,
-                },
+                structured_output=structured_output,
             )
-        # TODO: Tools Not supported in streaming yet
         else:
-            return self.get_unknown_content_type_item(
-                index=index,
-                role=role,
-                unknown_item=delta,
-                streaming=True,
-            )
+            if tool_call:
+                return ChatResponseToolCallContentItem(
+                    index=index,
+                    role=role,
+                    tool_call=tool_call,
+                    metadata={},
+                )
+            else:
+                return self.get_unknown_content_type_item(
+                    index=index,
+                    role=role,
+                    unknown_item=content_item,
+                    streaming=False,
+                )
+
+    _content_item_handlers = {
+        TextBlock: _process_text_block,
+        ThinkingBlock: _process_thinking_block,
+        RedactedThinkingBlock: _process_redacted_thinking_block,
+        ToolUseBlock: _process_tool_use_block,
+    }
+
+    # -------------------------------------------------------------------------
+    # Content item delta handlers
+    def _process_text_delta(self, index: int, role: str, delta: TextDelta) -> ChatResponseContentItemDelta:
+        return ChatResponseTextContentItemDelta(
+            index=index,
+            role=role,
+            text_delta=delta.text,
+        )
+
+    def _process_thinking_delta(self, index: int, role: str, delta: ThinkingDelta) -> ChatResponseContentItemDelta:
+        return ChatResponseReasoningContentItemDelta(
+            index=index,
+            role=role,
+            thinking_text_delta=delta.thinking,
+            metadata={},
+        )
+
+    def _process_signature_delta(self, index: int, role: str, delta: SignatureDelta) -> ChatResponseContentItemDelta:
+        return ChatResponseReasoningContentItemDelta(
+            index=index,
+            role=role,
+            thinking_text_delta="",
+            metadata={
+                "signature": delta.signature,
+            },
+        )
+
+    _content_item_delta_handlers = {
+        TextDelta: _process_text_delta,
+        ThinkingDelta: _process_thinking_delta,
+        SignatureDelta: _process_signature_delta,
+    }
@@ -3,6 +3,8 @@ from abc import ABC, abstractmethod
 from collections.abc import AsyncGenerator, Generator
 from typing import Any
 
+import httpx
+
 from dhenara.ai.config import settings
 from dhenara.ai.providers.base import StreamingManager
 from dhenara.ai.types import (
@@ -27,6 +29,17 @@ from dhenara.ai.types.shared.api import SSEErrorCode, SSEErrorData, SSEErrorResp
 logger = logging.getLogger(__name__)
 
 
+def _get_transport_error(exc: BaseException) -> httpx.TransportError | None:
+    """Returns the httpx transport error in the exception chain, as SDKs raise their connection errors from it"""
+    seen = set()
+    while exc is not None and id(exc) not in seen:
+        if isinstance(exc, httpx.TransportError):
+            return exc
+        seen.add(id(exc))
+        exc = exc.__cause__ or exc.__context__
+    return None
+
+
 class AIModelProviderClientBase(ABC):
     """Base class for AI model provider handlers"""
 
@@ -67,7 +80,9 @@ class AIModelProviderClientBase(ABC):
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         if self.is_async:
             await self._cleanup_async()
-            # INFO: Don't close the client here, it will be managed by the provider client
+            # INFO: Don't close the client here, it is pooled and closed along with its event loop.
+            # Drop the reference though, as the client is bound to the loop that may be closed next
+            self._client = None
             self._initialized = False
             self._initialized = False
 
@@ -112,7 +127,7 @@ class AIModelProviderClientBase(ABC):
         parsed_response: ChatResponse | None = None
         api_call_status: ExternalApiCallStatus | None = None
 
-        logger.debug(f"generate_response: prompt={prompt}, context={context}")
+        logger.debug("generate_response: prompt=%s, context=%s", prompt, context)
 
         api_call_params = self.get_api_call_params(
             prompt=prompt,
@@ -120,7 +135,7 @@ class AIModelProviderClientBase(ABC):
             instructions=instructions,
         )
 
-        logger.debug(f"generate_response: api_call_params: {api_call_params}")
+        logger.debug("generate_response: api_call_params: %s", api_call_params)
 
         if self.config.test_mode:
             from dhenara.ai.providers.common.dummy import DummyAIModelResponseFns
@@ -146,7 +161,8 @@ class AIModelProviderClientBase(ABC):
 
         except Exception as e:
             logger.exception(f"Error in generate_response_sync: {e}")
-            api_call_status = self._create_error_status(str(e))
+            api_call_status = self._create_api_error_status(e)
+            return AIModelCallResponse(status=api_call_status)
 
     async def generate_response_async(
         self,
@@ -157,7 +173,7 @@ class AIModelProviderClientBase(ABC):
         parsed_response: ChatResponse | None = None
         api_call_status: ExternalApiCallStatus | None = None
 
-        logger.debug(f"generate_response: prompt={prompt}, context={context}")
+        logger.debug("generate_response: prompt=%s, context=%s", prompt, context)
 
         api_call_params = self.get_api_call_params(
             prompt=prompt,
@@ -165,7 +181,7 @@ class AIModelProviderClientBase(ABC):
             instructions=instructions,
         )
 
-        logger.debug(f"generate_response: api_call_params: {api_call_params}")
+        logger.debug("generate_response: api_call_params: %s", api_call_params)
 
         if self.config.test_mode:
             from dhenara.ai.providers.common.dummy import DummyAIModelResponseFns
@@ -191,7 +207,8 @@ class AIModelProviderClientBase(ABC):
 
         except Exception as e:
             logger.exception(f"Error in generate_response_async: {e}")
-            api_call_status = self._create_error_status(str(e))
+            api_call_status = self._create_api_error_status(e)
+            return AIModelCallResponse(status=api_call_status)
 
     def _format_and_generate_response_sync(
         self,
@@ -288,9 +305,12 @@ class AIModelProviderClientBase(ABC):
         """Shared streaming logic with async/sync handling"""
         self.streaming_manager = StreamingManager(model_endpoint=self.model_endpoint)
 
+        # Bound once, as it is called for every chunk
+        parse_stream_chunk = self.parse_stream_chunk
+
         try:
             for chunk in stream:
-                processed_chunks = self.parse_stream_chunk(chunk)
+                processed_chunks = parse_stream_chunk(chunk)
                 for pchunk in processed_chunks:
                     yield pchunk, None
 
@@ -299,7 +319,7 @@ class AIModelProviderClientBase(ABC):
             yield done_chunk, None
 
             final_response = self.streaming_manager.complete()
-            logger.debug(f"API has stopped streaming, final_response={final_response}")
+            logger.debug("API has stopped streaming, final_response=%s", final_response)
 
             yield None, final_response
             return  # Stop the generator
@@ -320,9 +340,12 @@ class AIModelProviderClientBase(ABC):
         """Shared streaming logic with async/sync handling"""
         self.streaming_manager = StreamingManager(model_endpoint=self.model_endpoint)
 
+        # Bound once, as it is called for every chunk
+        parse_stream_chunk = self.parse_stream_chunk
+
         try:
             async for chunk in stream:
-                processed_chunks = self.parse_stream_chunk(chunk)
+                processed_chunks = parse_stream_chunk(chunk)
                 for pchunk in processed_chunks:
                     yield pchunk, None
 
@@ -511,6 +534,35 @@ class AIModelProviderClientBase(ABC):
             http_status_code=400,
         )
 
+    def _create_api_error_status(self, exc: Exception) -> ExternalApiCallStatus:
+        """Create error status for an exception raised while calling the API"""
+        # SDK errors carry the HTTP status as `status_code` (OpenAI, Anthropic) or `code` (Google)
+        http_status_code = getattr(exc, "status_code", None)
+        if http_status_code is None:
+            http_status_code = getattr(exc, "code", None)
+
+        transport_error = _get_transport_error(exc)
+        if isinstance(http_status_code, int) and 100 <= http_status_code <= 599:
+            status = ExternalApiCallStatusEnum.RESPONSE_RECEIVED_API_ERROR
+        elif isinstance(exc, TimeoutError) or isinstance(transport_error, httpx.TimeoutException):
+            status = ExternalApiCallStatusEnum.RESPONSE_TIMEOUT
+            http_status_code = None
+        elif isinstance(exc, ConnectionError) or transport_error is not None:
+            status = ExternalApiCallStatusEnum.REQUEST_SEND
+            http_status_code = None
+        else:
+            status = ExternalApiCallStatusEnum.INTERNAL_PROCESSING_ERROR
+            http_status_code = None
+
+        return ExternalApiCallStatus(
+            status=status,
+            api_provider=self.model_endpoint.api.provider,
+            model=self.model_endpoint.ai_model.model_name,
+            message=str(exc),
+            code="external_api_error",
+            http_status_code=http_status_code,
+        )
+
     def _create_streaming_error_response(self, exc: Exception | None = None, message: str | None = None):
         if exc:
             logger.exception(f"Error during streaming: {exc}")
@@ -539,7 +591,7 @@ class AIModelProviderClientBase(ABC):
         unknown_item: Any,
         streaming: bool,
     ):
-        logger.debug(f"Unknown content item type {type(unknown_item)}")
+        logger.debug("Unknown content item type %s", type(unknown_item))
 
         item_dict = {
             "index": index,
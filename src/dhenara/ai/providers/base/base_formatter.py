@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from typing import Any
 
 from dhenara.ai.types.genai.ai_model import AIModelEndpoint
@@ -16,6 +17,38 @@ from dhenara.ai.types.genai.dhenara.request import (
 )
 from dhenara.ai.types.shared.file import GenericFile
 
+# Texts longer than this are not cached, as they are unlikely to repeat
+_FORMATTED_PROMPT_CACHE_MAX_TEXT = 512
+
+# Role values keyed by member, which also match the plain string values, to skip an enum call per prompt
+_ROLE_VALUES = {role: role.value for role in PromptMessageRoleEnum}
+_ROLE_USER = PromptMessageRoleEnum.USER.value
+_ROLE_SYSTEM = PromptMessageRoleEnum.SYSTEM.value
+
+
+@lru_cache(maxsize=4096)
+def _get_cached_formatted_prompt(role: str, text: str) -> FormattedPrompt:
+    return FormattedPrompt.model_construct(role=role, text=text)
+
+
+def make_formatted_prompt(role: PromptMessageRoleEnum | str, text: str) -> FormattedPrompt:
+    """
+    Create a FormattedPrompt without re-validating inputs, which are already validated on the hot path.
+    Instances of short texts are shared, and should be treated as read-only.
+    """
+    if not isinstance(text, str):
+        # Let validation report the error
+        return FormattedPrompt(role=role, text=text)
+
+    role_value = _ROLE_VALUES.get(role)
+    if role_value is None:
+        # Let the enum report the error
+        role_value = PromptMessageRoleEnum(role).value
+
+    if len(text) < _FORMATTED_PROMPT_CACHE_MAX_TEXT:
+        return _get_cached_formatted_prompt(role_value, text)
+    return FormattedPrompt.model_construct(role=role_value, text=text)
+
 
 class BaseFormatter(ABC):
     """
@@ -32,50 +65,61 @@ class BaseFormatter(ABC):
         model_endpoint: AIModelEndpoint | None = None,
         **kwargs,
     ) -> FormattedPrompt:
-        # First convert a prompt to Dhenara Prompt format
-        if isinstance(prompt, str):
+        formatted_prompt, files, max_words_file = cls._prepare_prompt(prompt, **kwargs)
+
+        # Convert dhenara formated prompt and files to provider format
+        return cls.convert_prompt(
+            formatted_prompt=formatted_prompt,
+            model_endpoint=model_endpoint,
+            files=files,
+            max_words_file=max_words_file,
+        )
+
+    @classmethod
+    def _prepare_prompt(
+        cls,
+        prompt: str | dict | Prompt,
+        **kwargs,
+    ) -> tuple[FormattedPrompt, list[GenericFile], int | None]:
+        """Convert a prompt to a Dhenara formatted prompt, with its files and file word limit"""
+        # Prompt instances are the most common in conversation loops, so they are checked first
+        if isinstance(prompt, Prompt):
+            pyd_prompt = prompt
+        elif isinstance(prompt, str):
             # Formatted Prompt
-            formatted_prompt = FormattedPrompt(
-                role=PromptMessageRoleEnum.USER,
+            formatted_prompt = make_formatted_prompt(
+                role=_ROLE_USER,
                 text=prompt,
             )
-            files = []
-            max_words_file = None
+            return formatted_prompt, [], None
+        elif isinstance(prompt, dict):
+            pyd_prompt = Prompt.model_validate(prompt)
+        else:
+            raise ValueError(f"format_prompt: unknown prompt type {type(prompt)}. prompt={prompt}")
+
+        # Prompt.files is validated as list[GenericFile] on creation and assignment, no need to check it again
+        files = pyd_prompt.files
+        prompt_config = pyd_prompt.config
+        max_words_text = prompt_config.max_words_text if prompt_config else None
+        max_words_file = prompt_config.max_words_file if prompt_config else None
+
+        text = pyd_prompt.text
+        if type(text) is str and not max_words_text:
+            # Nothing to format in plain text
+            formatted_text = text
         else:
-            if isinstance(prompt, dict):
-                pyd_prompt = Prompt(**prompt)
-            elif isinstance(prompt, Prompt):
-                pyd_prompt = prompt
-            else:
-                raise ValueError(f"format_prompt: unknown prompt type {type(prompt)}. prompt={prompt}")
-
-            files = pyd_prompt.files
-            max_words_text = pyd_prompt.config.max_words_text if pyd_prompt.config else None
-            max_words_file = pyd_prompt.config.max_words_file if pyd_prompt.config else None
-
-            role = pyd_prompt.role
             formatted_text = pyd_prompt.get_formatted_text(
                 max_words=max_words_text,
                 **kwargs,
             )
-            # Formatted Prompt
-            formatted_prompt = FormattedPrompt(
-                role=role,
-                text=formatted_text,
-            )
-
-            # Do files sanity checks
-            if (files and not isinstance(files, list)) or not all(isinstance(f, GenericFile) for f in files):
-                raise ValueError(f"Invalid type {type(files)} for files. Should be list of GenericFile")
-
-        # Convert dhenara formated prompt and files to provider format
-        return cls.convert_prompt(
-            formatted_prompt=formatted_prompt,
-            model_endpoint=model_endpoint,
-            files=files,
-            max_words_file=max_words_file,
+        # Formatted Prompt
+        formatted_prompt = make_formatted_prompt(
+            role=pyd_prompt.role,
+            text=formatted_text,
         )
 
+        return formatted_prompt, files, max_words_file
+
     @classmethod
     def format_context(
         cls,
@@ -86,14 +130,20 @@ class BaseFormatter(ABC):
         if not context:
             return []
 
-        formatted_context = [
-            cls.format_prompt(
-                prompt=prompt,
-                model_endpoint=model_endpoint,
-                **kwargs,
+        # Single pass with the classmethods bound once, instead of a format_prompt() call per message
+        prepare_prompt = cls._prepare_prompt
+        convert_prompt = cls.convert_prompt
+        formatted_context = []
+        for prompt in context:
+            formatted_prompt, files, max_words_file = prepare_prompt(prompt, **kwargs)
+            formatted_context.append(
+                convert_prompt(
+                    formatted_prompt=formatted_prompt,
+                    model_endpoint=model_endpoint,
+                    files=files,
+                    max_words_file=max_words_file,
+                )
             )
-            for prompt in context
-        ]
         return formatted_context
 
     @classmethod
@@ -108,23 +158,15 @@ class BaseFormatter(ABC):
 
         def _process_single_instruction(instr):
             if isinstance(instr, str):
-                formatted = instr
-            else:
-                if isinstance(instr, SystemInstruction):
-                    _pyd_instr = instr
-                elif isinstance(instr, dict):
-                    _pyd_instr = SystemInstruction(**instr)
-                else:
-                    raise ValueError(f"Illegal instruction type {type(instr)}")
-
-                formatted = _pyd_instr.get_formatted_text(**kwargs)
-            return formatted
-
-        formatted_instructions = [_process_single_instruction(instr, **kwargs) for instr in instructions]
-
-        joined = " ".join(formatted_instructions)
+                return instr
+            if isinstance(instr, SystemInstruction):
+                return instr.get_formatted_text(**kwargs)
+            if isinstance(instr, dict):
+                return SystemInstruction(**instr).get_formatted_text(**kwargs)
+            raise ValueError(f"Illegal instruction type {type(instr)}")
 
-        return joined
+        # Plain strings are passed through as is, without a call per instruction
+        return " ".join([instr if type(instr) is str else _process_single_instruction(instr) for instr in instructions])
 
     @classmethod
     def format_instructions(
@@ -137,8 +179,8 @@ class BaseFormatter(ABC):
         joined_instructions = cls.join_instructions(instructions, **kwargs)
 
         # Formatted Prompt
-        formatted_prompt = FormattedPrompt(
-            role=PromptMessageRoleEnum.SYSTEM,
+        formatted_prompt = make_formatted_prompt(
+            role=_ROLE_SYSTEM,
             text=joined_instructions,
         )
 
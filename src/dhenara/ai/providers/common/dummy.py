@@ -257,10 +257,7 @@ so the issue is likely in how you're handling these tokens after receiving them
 
         if chunk_deltas:
             response_chunk = self.streaming_manager.update(choice_deltas=chunk_deltas)
-            stream_response = StreamingChatResponse(
-                id=None,
-                data=response_chunk,
-            )
+            stream_response = StreamingChatResponse.make(data=response_chunk)
 
         return stream_response
 
@@ -3,6 +3,7 @@ import logging
 from google import genai
 from google.genai.types import HttpOptions as GooogleHttpOptions
 
+from dhenara.ai.providers._client_pool import get_async_client, get_client_pool_key, get_sync_client
 from dhenara.ai.providers.base import AIModelProviderClientBase
 from dhenara.ai.providers.shared import APIProviderSharedFns
 from dhenara.ai.types.genai.ai_model import AIModelAPIProviderEnum
@@ -11,6 +12,9 @@ from .formatter import GoogleFormatter
 
 logger = logging.getLogger(__name__)
 
+# Models not supporting system instructions, which are sent as the first context message instead
+_LEGACY_INSTR_MODELS = ("gemini-1.0-pro",)
+
 
 class GoogleAIClientBase(AIModelProviderClientBase):
     """Base class for all Google AI Clients"""
@@ -18,7 +22,7 @@ class GoogleAIClientBase(AIModelProviderClientBase):
     formatter = GoogleFormatter
 
     def initialize(self) -> None:
-        pass
+        self._instruction_as_prompt_required = self.model_endpoint.ai_model.model_name.startswith(_LEGACY_INSTR_MODELS)
 
     def cleanup(self) -> None:
         pass
@@ -56,14 +60,21 @@ class GoogleAIClientBase(AIModelProviderClientBase):
             logger.error(error_msg)
             raise ValueError(error_msg)
 
-    def _setup_client_sync(self) -> genai.Client:
-        """Get the appropriate sync Google AI client"""
-        api = self.model_endpoint.api
-        client_type, params = self._get_client_params(api)
+    def _get_pool_key(self):
+        return get_client_pool_key("google", self.model_endpoint.api, timeout=self.config.timeout)
+
+    def _create_client_sync(self) -> genai.Client:
+        client_type, params = self._get_client_params(self.model_endpoint.api)
         return genai.Client(**params)
 
-    async def _setup_client_async(self) -> genai.Client:
-        """Get the appropriate async Google AI client"""
-        api = self.model_endpoint.api
-        client_type, params = self._get_client_params(api)
+    def _create_client_async(self) -> genai.Client:
+        client_type, params = self._get_client_params(self.model_endpoint.api)
         return genai.Client(**params).aio
+
+    def _setup_client_sync(self) -> genai.Client:
+        """Get the appropriate sync Google AI client, reusing pooled connections"""
+        return get_sync_client(self._get_pool_key(), self._create_client_sync)
+
+    async def _setup_client_async(self) -> genai.Client:
+        """Get the appropriate async Google AI client, reusing pooled connections"""
+        return await get_async_client(self._get_pool_key(), self._create_client_async)
@@ -37,9 +37,6 @@ logger = logging.getLogger(__name__)
 logger = logging.getLogger(__name__)
 
 
-models_not_supporting_system_instructions = ["gemini-1.0-pro"]
-
-
 # -----------------------------------------------------------------------------
 class GoogleAIChat(GoogleAIClientBase):
     def get_api_call_params(
@@ -67,7 +64,7 @@ class GoogleAIChat(GoogleAIClientBase):
                 )
 
             # Some models don't support system instructions
-            if any(self.model_endpoint.ai_model.model_name.startswith(model) for model in ["gemini-1.0-pro"]):
+            if self._instruction_as_prompt_required:
                 instruction_as_prompt = instructions
 
                 if context:
@@ -223,10 +220,7 @@ class GoogleAIChat(GoogleAIClientBase):
                 )
 
             response_chunk = self.streaming_manager.update(choice_deltas=choice_deltas)
-            stream_response = StreamingChatResponse(
-                id=None,  # No 'id' from google
-                data=response_chunk,
-            )
+            stream_response = StreamingChatResponse.make(data=response_chunk)
 
             processed_chunks.append(stream_response)
 
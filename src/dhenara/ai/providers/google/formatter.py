@@ -18,6 +18,28 @@ from dhenara.ai.types.shared.file import FileFormatEnum, GenericFile
 logger = logging.getLogger(__name__)
 
 
+def _convert_text_file(file: GenericFile, max_words: int | None) -> dict[str, Any]:
+    return {
+        "text": f"\nFile: {file.get_source_file_name()}  Content: {file.get_processed_file_data(max_words)}",
+    }
+
+
+def _convert_image_file(file: GenericFile, max_words: int | None) -> dict[str, Any]:
+    return {
+        "inline_data": {
+            "data": file.get_processed_file_data_content_only(),  # Bytes type
+            "mime_type": file.get_mime_type(),
+        },
+    }
+
+
+_FILE_CONTENT_HANDLERS = {
+    FileFormatEnum.COMPRESSED: _convert_text_file,
+    FileFormatEnum.TEXT: _convert_text_file,
+    FileFormatEnum.IMAGE: _convert_image_file,
+}
+
+
 class GoogleFormatter(BaseFormatter):
     """
     Formatter for converting Dhenara types to Google-specific formats and vice versa.
@@ -38,7 +60,6 @@ class GoogleFormatter(BaseFormatter):
         max_words_file: int | None = None,
     ) -> dict[str, Any]:
         # Map Dhenara formats to provider format
-        parts = []
         file_contents = None
         if files:
             file_contents = cls.convert_files_to_provider_content(
@@ -54,13 +75,10 @@ class GoogleFormatter(BaseFormatter):
         #        file_contents=file_contents,
         #    )
 
-        parts.append(
-            {
-                "text": formatted_prompt.text,
-            }
-        )
-        if file_contents:
-            parts.extend(file_contents)
+        text_part = {
+            "text": formatted_prompt.text,
+        }
+        parts = [text_part, *file_contents] if file_contents else [text_part]
 
         role = cls.role_map.get(formatted_prompt.role)
         return {"role": role, "parts": parts}
@@ -102,24 +120,9 @@ class GoogleFormatter(BaseFormatter):
         contents = []
         for file in files:
             file_format = file.get_file_format()
-            if file_format in [FileFormatEnum.COMPRESSED, FileFormatEnum.TEXT]:
-                text = f"\nFile: {file.get_source_file_name()}  Content: {file.get_processed_file_data(max_words)}"
-                pcontent = text
-                contents.append(
-                    {
-                        "text": pcontent,
-                    }
-                )
-            elif file_format in [FileFormatEnum.IMAGE]:
-                mime_type = file.get_mime_type()
-                contents.append(
-                    {
-                        "inline_data": {
-                            "data": file.get_processed_file_data_content_only(),  # Bytes type
-                            "mime_type": mime_type,
-                        },
-                    }
-                )
+            handler = _FILE_CONTENT_HANDLERS.get(file_format)
+            if handler is not None:
+                contents.append(handler(file, max_words))
             else:
                 logger.error(f"get_prompt_file_contents: Unknown file_format {file_format} for file {file.name} ")
 
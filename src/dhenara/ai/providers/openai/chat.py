@@ -214,7 +214,7 @@ class OpenAIChat(OpenAIClientBase):
                 )
 
             response_chunk = self.streaming_manager.update(choice_deltas=choice_deltas)
-            stream_response = StreamingChatResponse(
+            stream_response = StreamingChatResponse.make(
                 id=chunk.id,
                 data=response_chunk,
             )
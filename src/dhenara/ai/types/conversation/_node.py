@@ -1,4 +1,6 @@
-from pydantic import Field
+from typing import Any
+
+from pydantic import Field, PrivateAttr
 
 from dhenara.ai.types.genai.dhenara import ChatResponse, ImageResponse
 from dhenara.ai.types.genai.dhenara.request import Prompt, PromptConfig, PromptMessageRoleEnum
@@ -14,6 +16,30 @@ class ConversationNode(BaseModel):
     response: ChatResponse | ImageResponse | None = None
     timestamp: str | None = None
 
+    # Context prompts built by `get_context()`, keyed by its arguments. Not serialized
+    _context_cache: dict[tuple, list[Prompt]] = PrivateAttr(default_factory=dict)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if not name.startswith("_"):
+            self.invalidate_context_cache()
+
+    def __copy__(self) -> "ConversationNode":
+        copied = super().__copy__()
+        # Private attributes are copied shallowly, so give the copy a cache of its own.
+        # `model_copy(update=...)` sets fields without `__setattr__`, so it can't rely on invalidation
+        copied._context_cache = {}
+        return copied
+
+    def __deepcopy__(self, memo: dict[int, Any] | None = None) -> "ConversationNode":
+        copied = super().__deepcopy__(memo)
+        copied._context_cache = {}
+        return copied
+
+    def invalidate_context_cache(self) -> None:
+        """Clear the cached context. Call this after modifying the `response` in place"""
+        self._context_cache.clear()
+
     def get_prompt(
         self,
         max_words_query=None,
@@ -34,6 +60,28 @@ class ConversationNode(BaseModel):
         max_words_query=None,
         max_words_file=None,
         max_words_response=None,
+    ) -> list[Prompt]:
+        """
+        Returns the user query and the response of this turn as context prompts for the next turns.
+        Prompts are built once per set of arguments and reused, as previous turns are sent on every turn.
+        """
+        cache_key = (max_words_query, max_words_file, max_words_response)
+        cached = self._context_cache.get(cache_key)
+        if cached is None:
+            cached = self._build_context(
+                max_words_query=max_words_query,
+                max_words_file=max_words_file,
+                max_words_response=max_words_response,
+            )
+            self._context_cache[cache_key] = cached
+
+        return list(cached)
+
+    def _build_context(
+        self,
+        max_words_query=None,
+        max_words_file=None,
+        max_words_response=None,
     ) -> list[Prompt]:
         question_prompt = Prompt(
             role=PromptMessageRoleEnum.USER,
@@ -49,3 +97,23 @@ class ConversationNode(BaseModel):
         )
 
         return [question_prompt, response_prompt]
+
+
+def get_conversation_context(
+    nodes: list[ConversationNode],
+    max_words_query=None,
+    max_words_file=None,
+    max_words_response=None,
+) -> list[Prompt]:
+    """
+    Returns the context prompts of a conversation, as one user and one assistant prompt per node in turn order.
+    Each turn is kept as its own message pair, so the context of a turn is always a prefix of the next turn's context.
+    """
+    context = []
+    for node in nodes:
+        context += node.get_context(
+            max_words_query=max_words_query,
+            max_words_file=max_words_file,
+            max_words_response=max_words_response,
+        )
+    return context
@@ -1,4 +1,6 @@
 import logging
+from functools import lru_cache
+from typing import Literal
 
 from pydantic import BaseModel as PydanticBaseModel
 from pydantic import model_validator
@@ -14,6 +16,50 @@ from dhenara.ai.types.shared.base import BaseModel
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=256)
+def _compute_max_tokens(
+    reasoning: bool,
+    req_max_out: int | None,
+    req_max_reason: int | None,
+    settings_max_out: int | None,
+    settings_max_out_reason: int | None,
+    settings_max_reason: int | None,
+    supports_reasoning: bool,
+    model_name: str,
+) -> tuple[int, int | None]:
+    # Determine which max output tokens to use based on reasoning mode
+    if not reasoning:
+        _settings_max_output_tokens = settings_max_out
+        _reasoning_capable = False
+    elif not supports_reasoning:  # Don't flag an error
+        _settings_max_output_tokens = settings_max_out
+        _reasoning_capable = False
+    else:
+        _settings_max_output_tokens = settings_max_out_reason
+        _reasoning_capable = True
+
+    if not _settings_max_output_tokens:
+        token_type = "max_output_tokens_reasoning_mode" if _reasoning_capable else "max_output_tokens"
+        raise ValueError(f"Invalid call-config. {token_type} is not set in model {model_name}.")
+
+    # Set max output tokens
+    max_output_tokens = min(
+        req_max_out if req_max_out is not None else _settings_max_output_tokens,
+        _settings_max_output_tokens,
+    )
+
+    # Set max reasoning tokens
+    if not _reasoning_capable or not reasoning or settings_max_reason is None:
+        max_reasoning_tokens = None
+    else:
+        max_reasoning_tokens = min(
+            req_max_reason if req_max_reason is not None else settings_max_reason,
+            settings_max_reason,
+        )
+
+    return (max_output_tokens, max_reasoning_tokens)
+
+
 # TODO_FUTURE:
 # Create seperate class for the parameter required conversion,
 # class AIModelCallData(BaseModel):
@@ -26,6 +72,11 @@ class AIModelCallConfig(BaseModel):
     """Configuration for AI model calls"""
 
     streaming: bool = False
+    # Streamed text deltas are buffered, and sent once `stream_flush_chars` characters are collected,
+    # `stream_flush_interval` seconds have passed since the last send, or the content block ends.
+    # None sends every delta as received. Only honoured by Anthropic
+    stream_flush_chars: int | None = None
+    stream_flush_interval: float | None = None
     max_output_tokens: int | None = None
     reasoning: bool = False
     max_reasoning_tokens: int | None = None
@@ -35,6 +86,14 @@ class AIModelCallConfig(BaseModel):
     tool_choice: ToolChoice | None = None
 
     structured_output: type[PydanticBaseModel] | StructuredOutputConfig | None = None
+    # Opt-in: Cap the output of structured responses by an estimate from the schema, when max_output_tokens
+    # is not set. Never raises the model limit, and is ignored with reasoning. Don't enable for models
+    # spending hidden reasoning tokens from the output budget (Eg: OpenAI o-series), as outputs get truncated
+    cap_structured_output_tokens: bool = False
+
+    # Provider side prompt caching. Only honoured by providers with explicit cache breakpoints (Anthropic)
+    enable_prompt_cache: bool = True
+    cache_ttl: Literal["5m", "1h"] | None = None
 
     metadata: dict = {}
     timeout: float | None = None
@@ -66,34 +125,25 @@ class AIModelCallConfig(BaseModel):
 
         _settings = model.get_settings()
 
-        # Determine which max output tokens to use based on reasoning mode
-        if not self.reasoning:
-            _settings_max_output_tokens = _settings.max_output_tokens
-            _reasoning_capable = False
-        elif not _settings.supports_reasoning:  # Don't flag an error
-            _settings_max_output_tokens = _settings.max_output_tokens
-            _reasoning_capable = False
-        else:
-            _settings_max_output_tokens = _settings.max_output_tokens_reasoning_mode
-            _reasoning_capable = True
-
-        if not _settings_max_output_tokens:
-            token_type = "max_output_tokens_reasoning_mode" if _reasoning_capable else "max_output_tokens"
-            raise ValueError(f"Invalid call-config. {token_type} is not set in model {model.model_name}.")
-
-        # Set max output tokens
-        max_output_tokens = min(
-            self.max_output_tokens if self.max_output_tokens is not None else _settings_max_output_tokens,
-            _settings_max_output_tokens,
+        max_output_tokens = self.max_output_tokens
+        if (
+            max_output_tokens is None
+            and self.cap_structured_output_tokens
+            and self.structured_output is not None
+            and not self.reasoning
+            and not _settings.supports_reasoning
+        ):
+            # Only lowers the limit, as the model limit is still applied on top
+            max_output_tokens = self.structured_output.estimate_max_output_tokens()
+
+        # Positional args, as lru_cache builds a much cheaper key for them than for keyword args
+        return _compute_max_tokens(
+            bool(self.reasoning),
+            max_output_tokens,
+            self.max_reasoning_tokens,
+            _settings.max_output_tokens,
+            _settings.max_output_tokens_reasoning_mode,
+            _settings.max_reasoning_tokens,
+            bool(_settings.supports_reasoning),
+            model.model_name,
         )
-
-        # Set max reasoning tokens
-        if not _reasoning_capable or not self.reasoning or _settings.max_reasoning_tokens is None:
-            max_reasoning_tokens = None
-        else:
-            max_reasoning_tokens = min(
-                self.max_reasoning_tokens if self.max_reasoning_tokens is not None else _settings.max_reasoning_tokens,
-                _settings.max_reasoning_tokens,
-            )
-
-        return (max_output_tokens, max_reasoning_tokens)
@@ -1,3 +1,6 @@
+import copy
+import re
+from functools import lru_cache
 from typing import Any
 
 from pydantic import BaseModel as PydanticBaseModel
@@ -6,6 +9,181 @@ from pydantic import Field
 from dhenara.ai.types.shared.base import BaseModel
 
 
+@lru_cache(maxsize=256)
+def _get_model_json_schema(model_class: type[PydanticBaseModel]) -> dict[str, Any]:
+    """JSON schema generation walks the whole model, so do it once per model class.
+    The returned schema is shared, and should be treated as read-only"""
+    return model_class.model_json_schema()
+
+
+# Output token budgets of values without explicit bounds in the schema
+_DEFAULT_STRING_TOKENS = 64
+_DEFAULT_ARRAY_ITEMS = 8
+_MAX_SCHEMA_DEPTH = 16
+
+
+def _estimate_schema_tokens(schema: dict[str, Any], defs: dict[str, Any], depth: int = 0) -> int:
+    if depth > _MAX_SCHEMA_DEPTH or not isinstance(schema, dict):
+        return _DEFAULT_STRING_TOKENS
+
+    ref = schema.get("$ref")
+    if ref:
+        return _estimate_schema_tokens(defs.get(ref.rsplit("/", 1)[-1], {}), defs, depth + 1)
+
+    variants = schema.get("anyOf") or schema.get("oneOf")
+    if variants:
+        return max(_estimate_schema_tokens(variant, defs, depth + 1) for variant in variants)
+
+    if "enum" in schema:
+        return max((len(str(value)) // 4 + 2 for value in schema["enum"]), default=2)
+
+    schema_type = schema.get("type")
+    if schema_type == "object" or "properties" in schema:
+        # Key, quotes, colon and comma per property, plus the braces
+        return 2 + sum(
+            len(name) // 4 + 4 + _estimate_schema_tokens(prop_schema, defs, depth + 1)
+            for name, prop_schema in schema.get("properties", {}).items()
+        )
+    elif schema_type == "array":
+        items = schema.get("maxItems") or max(schema.get("minItems", 0), _DEFAULT_ARRAY_ITEMS)
+        return 2 + items * (1 + _estimate_schema_tokens(schema.get("items", {}), defs, depth + 1))
+    elif schema_type == "string":
+        max_length = schema.get("maxLength")
+        return max_length // 4 + 2 if max_length else _DEFAULT_STRING_TOKENS
+    elif schema_type in ("integer", "number"):
+        return 4
+    elif schema_type in ("boolean", "null"):
+        return 2
+    return _DEFAULT_STRING_TOKENS
+
+
+def estimate_max_output_tokens(schema: dict[str, Any], safety_factor: float = 1.5) -> int:
+    """
+    Estimate the output tokens needed for a JSON response conforming to `schema`.
+    Uses maxLength/maxItems where set, and fixed budgets for unbounded strings and arrays.
+    """
+    return int(_estimate_schema_tokens(schema, schema.get("$defs", {})) * safety_factor)
+
+
+# JSON schema keywords holding subschemas. Other keywords, like `default` or `examples`, hold data and are left alone
+_SUBSCHEMA_KEYWORDS = (
+    "items",
+    "additionalProperties",
+    "additionalItems",
+    "unevaluatedProperties",
+    "unevaluatedItems",
+    "contains",
+    "propertyNames",
+    "not",
+    "if",
+    "then",
+    "else",
+)
+_SUBSCHEMA_LIST_KEYWORDS = ("anyOf", "oneOf", "allOf", "prefixItems")
+_SUBSCHEMA_DICT_KEYWORDS = ("$defs", "definitions", "patternProperties", "dependentSchemas")
+
+
+@lru_cache(maxsize=256)
+def _make_field_alias_map(names: tuple[str, ...]) -> dict[str, str]:
+    """Map the property names of one schema object to short aliases, built from the initials of their words"""
+    alias_map = {}
+    used = set()
+    for name in names:
+        words = re.findall(r"[A-Z]?[a-z0-9]+|[A-Z]+(?![a-z])", name)
+        base = "".join(word[0].lower() for word in words) or "f"
+        alias, suffix = base, 2
+        while alias in used:
+            alias = f"{base}{suffix}"
+            suffix += 1
+        used.add(alias)
+        alias_map[name] = alias
+    return alias_map
+
+
+def _rename_schema_properties(schema: Any) -> Any:
+    """Returns a copy of the schema, with the properties of each object renamed to aliases unique in that object"""
+    if not isinstance(schema, dict):
+        return copy.deepcopy(schema)
+
+    renamed = {}
+    for key, value in schema.items():
+        if key == "properties" and isinstance(value, dict):
+            alias_map = _make_field_alias_map(tuple(value))
+            renamed[key] = {
+                alias_map[name]: _rename_schema_properties(prop_schema) for name, prop_schema in value.items()
+            }
+        elif key == "required" and isinstance(value, list) and isinstance(schema.get("properties"), dict):
+            alias_map = _make_field_alias_map(tuple(schema["properties"]))
+            renamed[key] = [alias_map.get(name, name) for name in value]
+        elif key in _SUBSCHEMA_KEYWORDS:
+            renamed[key] = _rename_schema_properties(value)
+        elif key in _SUBSCHEMA_LIST_KEYWORDS and isinstance(value, list):
+            renamed[key] = [_rename_schema_properties(variant) for variant in value]
+        elif key in _SUBSCHEMA_DICT_KEYWORDS and isinstance(value, dict):
+            renamed[key] = {name: _rename_schema_properties(sub_schema) for name, sub_schema in value.items()}
+        else:
+            renamed[key] = copy.deepcopy(value)
+    return renamed
+
+
+def _resolve_schema(schema: Any, defs: dict[str, Any], depth: int = 0) -> dict[str, Any]:
+    while isinstance(schema, dict) and "$ref" in schema and depth <= _MAX_SCHEMA_DEPTH:
+        schema = defs.get(schema["$ref"].rsplit("/", 1)[-1], {})
+        depth += 1
+    return schema if isinstance(schema, dict) else {}
+
+
+def _select_variant(data: Any, schema: dict[str, Any], defs: dict[str, Any]) -> dict[str, Any]:
+    """Pick the union variant matching the shape of the data, preferring objects whose aliases cover its keys"""
+    variants = schema.get("anyOf") or schema.get("oneOf") or schema.get("allOf")
+    if not variants:
+        return schema
+
+    variants = [_resolve_schema(variant, defs) for variant in variants]
+    if isinstance(data, dict):
+        objects = [variant for variant in variants if "properties" in variant or "additionalProperties" in variant]
+        for variant in objects:
+            aliases = _make_field_alias_map(tuple(variant.get("properties", {}))).values()
+            if set(data) <= set(aliases):
+                return variant
+        return objects[0] if objects else {}
+    elif isinstance(data, list):
+        return next((variant for variant in variants if "items" in variant or "prefixItems" in variant), {})
+    return {}
+
+
+def _rename_data_keys(data: Any, schema: Any, defs: dict[str, Any]) -> Any:
+    """Map aliased keys in the data back to property names, following the schema of each value"""
+    schema = _select_variant(data, _resolve_schema(schema, defs), defs)
+
+    if isinstance(data, dict):
+        properties = schema.get("properties")
+        if not isinstance(properties, dict):
+            properties = {}
+        name_map = {alias: name for name, alias in _make_field_alias_map(tuple(properties)).items()}
+        # Values under other keys are free-form, unless the schema has one for additional properties
+        additional_schema = schema.get("additionalProperties")
+        renamed = {}
+        for key, value in data.items():
+            name = name_map.get(key)
+            if name is not None:
+                renamed[name] = _rename_data_keys(value, properties[name], defs)
+            elif isinstance(additional_schema, dict):
+                renamed[key] = _rename_data_keys(value, additional_schema, defs)
+            else:
+                renamed[key] = value
+        return renamed
+    elif isinstance(data, list):
+        prefix_items = schema.get("prefixItems") or []
+        items_schema = schema.get("items")
+        renamed = []
+        for i, value in enumerate(data):
+            item_schema = prefix_items[i] if i < len(prefix_items) else items_schema
+            renamed.append(_rename_data_keys(value, item_schema, defs) if isinstance(item_schema, dict) else value)
+        return renamed
+    return data
+
+
 class StructuredOutputConfig(BaseModel):
     """Configuration for structured output"""
 
@@ -22,17 +200,38 @@ class StructuredOutputConfig(BaseModel):
         exclude=True,  # This ensures it's excluded from serialization
     )
 
+    compact_field_names: bool = Field(
+        default=False,
+        description=(
+            "Send short aliases of the property names to the model, to cut output tokens. "
+            "Responses are mapped back to the original names before validation"
+        ),
+    )
+
     @classmethod
-    def from_model(cls, model_class: type[PydanticBaseModel]):
+    def from_model(cls, model_class: type[PydanticBaseModel], compact_field_names: bool = False):
         """Create config from a model class"""
         return cls(
-            output_schema=model_class.model_json_schema(),
+            output_schema=_get_model_json_schema(model_class),
             model_class_reference=model_class,  # Store the reference for programmatic access
+            compact_field_names=compact_field_names,
         )
 
     def get_schema(self) -> dict[str, Any]:
-        """Get the schema object"""
-        return self.output_schema
+        """Get a copy of the schema object, which is safe to modify for provider specific formats"""
+        if self.compact_field_names:
+            return _rename_schema_properties(self.output_schema)
+        return copy.deepcopy(self.output_schema)
+
+    def expand_field_names(self, data: Any) -> Any:
+        """Map aliased property names in model output back to the original names"""
+        if not self.compact_field_names:
+            return data
+        return _rename_data_keys(data, self.output_schema, self.output_schema.get("$defs", {}))
+
+    def estimate_max_output_tokens(self, safety_factor: float = 1.5) -> int:
+        """Estimate the output tokens needed for a response, from the schema sent to the model"""
+        return estimate_max_output_tokens(self.get_schema(), safety_factor=safety_factor)
 
     def get_model_class(self) -> type[PydanticBaseModel] | None:
         """Get the model class for Python operations"""
@@ -1,6 +1,6 @@
 from typing import Any
 
-from pydantic import Field, model_validator
+from pydantic import ConfigDict, Field, model_validator
 
 from dhenara.ai.types.shared.base import BaseModel
 from dhenara.ai.types.shared.file import GenericFile
@@ -133,6 +133,9 @@ class Prompt(BaseTextPrompt):
 
 
 class FormattedPrompt(BaseModel):
+    # Frozen, as instances of short texts are shared by the formatters
+    model_config = ConfigDict(frozen=True)
+
     role: PromptMessageRoleEnum
     text: str
 
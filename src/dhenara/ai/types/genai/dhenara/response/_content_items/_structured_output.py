@@ -129,7 +129,7 @@ class ChatResponseStructuredOutput(BaseModel):
                     initial_data = raw_data
 
             # Step 2: Recursively normalize all nested JSON strings
-            normalized_data = _coerce_json_strings(initial_data)
+            normalized_data = config.expand_field_names(_coerce_json_strings(initial_data))
 
             # Step 3: Get model class from config
             model_cls: type[PydanticBaseModel] = None
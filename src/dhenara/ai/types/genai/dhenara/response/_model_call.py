@@ -75,17 +75,21 @@ class AIModelCallResponse(BaseModel):
         Returns:
             ChatResponse | ImageResponse | None: The complete response object
         """
-        return self.chat_response if self.chat_response else self.image_response
+        # Plain field reads, rather than cached properties, which would go stale when a field is reassigned
+        chat_response = self.chat_response
+        return chat_response if chat_response is not None else self.image_response
 
     @property
     def stream_generator(self) -> AsyncGenerator | Generator | None:
-        return self.async_stream_generator if self.async_stream_generator else self.sync_stream_generator
+        async_stream_generator = self.async_stream_generator
+        return async_stream_generator if async_stream_generator is not None else self.sync_stream_generator
 
     def preview_dict(self):
         """
         Returns a preview version of the response excluding the choices
         """
-        if self.full_response is None:
+        full_response = self.full_response
+        if full_response is None:
             return None
 
-        return self.full_response.preview_dict()
+        return full_response.preview_dict()
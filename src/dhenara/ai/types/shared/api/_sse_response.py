@@ -1,14 +1,44 @@
 import json
-from typing import Any, Generic, TypeVar
+import re
+from typing import Any, Generic, NamedTuple, TypeVar
 from uuid import uuid4
 
 from pydantic import Field
 
 from dhenara.ai.types.shared.base import BaseEnum, BaseModel
 
+try:
+    import orjson
+except ImportError:  # Optional, install with `dhenara-ai[fast-json]`
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # Optional, only needed to stream msgspec Struct data
+    msgspec = None
+
+_msgspec_encoder = msgspec.json.Encoder() if msgspec is not None else None
+
 # Type variable for generic data types
 T = TypeVar("T", bound=BaseModel)
 
+# A `field: value` line of an SSE event, with whitespace around the field and before the value ignored
+_SSE_LINE_RE = re.compile(r"^[^\S\n]*([^:\n]*?)[^\S\n]*:[^\S\n]*([^\n]*)$", re.MULTILINE)
+
+
+def _json_dumps(data: Any) -> str:
+    if orjson is not None:
+        try:
+            return orjson.dumps(data).decode()
+        except TypeError:
+            pass  # Eg: non-str keys, left to the stdlib encoder
+    return json.dumps(data)
+
+
+def _json_loads(data: str) -> Any:
+    # orjson.JSONDecodeError is a subclass of json.JSONDecodeError
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
 
 class SSEEventType(BaseEnum):
     """Types of Server-Sent Events"""
@@ -18,12 +48,21 @@ class SSEEventType(BaseEnum):
     ERROR = "error"  # Error events
 
 
+# Formatting an enum in an f-string goes through Enum.__format__, a dict lookup of the value is much cheaper
+_SSE_EVENT_VALUES = {event: event.value for event in SSEEventType}
+# Likewise for parsing, instead of an enum call per event
+_SSE_EVENT_TYPES = {event.value: event for event in SSEEventType}
+
+
 class SSEErrorCode(BaseEnum):
     server_error = "server_error"
     external_api_error = "external_api_error"
     client_decode_error = "client_decode_error"
 
 
+_SSE_ERROR_CODES = {code.value: code for code in SSEErrorCode}
+
+
 class SSEErrorData(BaseModel):
     """Model for error response data"""
 
@@ -53,7 +92,7 @@ class SSEResponse(BaseModel, Generic[T]):
         description="Event data payload",
     )
     id: str | None = Field(
-        default=lambda: None,
+        default=None,
         # default_factory=lambda: str(uuid4()),
         description="Unique event identifier",
     )
@@ -62,8 +101,24 @@ class SSEResponse(BaseModel, Generic[T]):
         description="Retry timeout in milliseconds",
     )
 
-    class Config:
-        arbitrary_types_allowed = True
+    @classmethod
+    def make(
+        cls,
+        data: T,
+        event: SSEEventType | None = None,
+        id: str | None = None,  # noqa: A002
+        retry: int | None = None,
+    ) -> "SSEResponse[T]":
+        """
+        Create a response without validation, for the streaming hot path.
+        `data` should already be a validated instance, and `event` defaults to the class default.
+        """
+        fields = {"data": data, "id": id, "retry": retry}
+        if event is not None:
+            fields["event"] = event
+        elif cls.model_fields["event"].is_required():
+            raise ValueError(f"{cls.__name__}.make: event is required")
+        return cls.model_construct(**fields)
 
     def set_random_id(self) -> str:
         self.id = str(uuid4())
@@ -71,38 +126,43 @@ class SSEResponse(BaseModel, Generic[T]):
     def is_error(self) -> bool:
         return self.event == SSEEventType.ERROR
 
-    def to_sse_format(self) -> str:
-        """Convert to SSE format string"""
-        lines = []
-
-        # Add event type
-        lines.append(f"event: {self.event}")
-
-        # Add ID
-        lines.append(f"id: {self.id}")
-
-        # Add retry if present
-        if self.retry is not None:
-            lines.append(f"retry: {self.retry}")
-
-        # Add data
+    def _get_data_str(self) -> str:
         if isinstance(self.data, BaseModel):
-            data_str = self.data.model_dump_json()
+            # Serialized by pydantic-core, which is already native
+            return self.data.model_dump_json()
         elif isinstance(self.data, (dict, list)):
-            data_str = json.dumps(self.data)
+            return _json_dumps(self.data)
+        elif msgspec is not None and isinstance(self.data, msgspec.Struct):
+            # Struct data of responses created with `make()`, skipping pydantic altogether
+            return _msgspec_encoder.encode(self.data).decode()
         else:
-            data_str = str(self.data)
+            return str(self.data)
+
+    def to_sse_format(self) -> str:
+        """Convert to SSE format string"""
+        data_str = self._get_data_str()
+        event = _SSE_EVENT_VALUES.get(self.event, self.event)
+        retry = self.retry
+
+        # Fast path for single line data, which is always the case for JSON payloads.
+        # Streamed events have no retry, so that shape is formatted without the retry line
+        if data_str and "\n" not in data_str and "\r" not in data_str:
+            if retry is None:
+                return f"event: {event}\nid: {self.id}\ndata: {data_str}\n\n"
+            return f"event: {event}\nid: {self.id}\nretry: {retry}\ndata: {data_str}\n\n"
 
         # Handle multi-line data
-        for line in data_str.splitlines():
-            lines.append(f"data: {line}")  # noqa: PERF401
+        retry_line = f"retry: {retry}\n" if retry is not None else ""
+        data_lines = "".join(f"data: {line}\n" for line in data_str.splitlines())
+        return f"event: {event}\nid: {self.id}\n{retry_line}{data_lines}\n"
 
-        return "\n".join(lines) + "\n\n"
+    def to_sse_bytes(self) -> bytes:
+        """Convert to SSE format, encoded to be written to the response stream"""
+        return self.to_sse_format().encode()
 
     @classmethod
     def parse_sse(cls, sse_str: str, data_type: T | None = None) -> "SSEResponse[Any]":
         """Parse SSE format string into response object"""
-        lines = sse_str.strip().split("\n")
         event_data = {
             "event": None,
             "id": None,
@@ -112,26 +172,16 @@ class SSEResponse(BaseModel, Generic[T]):
 
         data_lines = []
 
-        for line in lines:
-            if not line.strip():
-                continue
-
-            if ":" not in line:
-                continue
-
-            field, value = line.split(":", 1)
-            field = field.strip()
-            value = value.lstrip()
-
+        # Lines without a `:` are skipped
+        for field, value in _SSE_LINE_RE.findall(sse_str.strip()):
             if field == "data":
                 data_lines.append(value)
             elif field in event_data:
                 event_data[field] = value
 
         # Parse event type first
-        try:
-            event_type = SSEEventType(event_data["event"]) if event_data["event"] else SSEEventType.ERROR
-        except ValueError:
+        event_type = _SSE_EVENT_TYPES.get(event_data["event"]) if event_data["event"] else SSEEventType.ERROR
+        if event_type is None:
             return SSEErrorResponse(
                 data=SSEErrorData(
                     error_code=SSEErrorCode.client_decode_error,
@@ -142,12 +192,15 @@ class SSEResponse(BaseModel, Generic[T]):
         # Join and parse data
         if data_lines:
             try:
-                raw_data = json.loads("".join(data_lines))
+                raw_data = _json_loads("".join(data_lines))
 
                 # Handle different event types
                 if event_type == SSEEventType.ERROR:
+                    error_code = raw_data.get("error_code", SSEErrorCode.server_error)
+                    # Non str values can't be looked up, these and unknown codes are left to the enum to report
+                    known_error_code = _SSE_ERROR_CODES.get(error_code) if isinstance(error_code, str) else None
                     data = SSEErrorData(
-                        error_code=SSEErrorCode(raw_data.get("error_code", SSEErrorCode.server_error)),
+                        error_code=known_error_code or SSEErrorCode(error_code),
                         message=raw_data.get("message", "Unknown error"),
                         details=raw_data.get("details"),
                     )
@@ -209,3 +262,34 @@ class SSEErrorResponse(SSEResponse[SSEErrorData]):
 
     event: SSEEventType = SSEEventType.ERROR
     data: SSEErrorData
+
+
+class SSEFrame(NamedTuple):
+    """
+    Lightweight SSE event, with its data already serialized.
+
+    For streaming servers relaying events, where building an SSEResponse per event isn't needed.
+    Encodes to the same bytes as an SSEResponse with the same fields. Use `to_response()` where the
+    model is expected.
+    """
+
+    event: SSEEventType | str
+    data_bytes: bytes
+    id: str | None = None
+    retry: int | None = None
+
+    def to_sse_bytes(self) -> bytes:
+        """Convert to SSE format, encoded to be written to the response stream"""
+        event = _SSE_EVENT_VALUES.get(self.event, self.event)
+        retry_line = f"retry: {self.retry}\n" if self.retry is not None else ""
+        head = f"event: {event}\nid: {self.id}\n{retry_line}".encode()
+
+        data_bytes = self.data_bytes
+        if data_bytes and b"\n" not in data_bytes and b"\r" not in data_bytes:
+            return head + b"data: " + data_bytes + b"\n\n"
+
+        return head + b"".join(b"data: " + line + b"\n" for line in data_bytes.splitlines()) + b"\n"
+
+    def to_response(self, data_type: T | None = None) -> SSEResponse[Any]:
+        """Convert to an SSEResponse, parsing the data as `parse_sse()` does"""
+        return SSEResponse.parse_sse(self.to_sse_bytes().decode(), data_type=data_type)
@@ -0,0 +1,105 @@
+from anthropic.types import (
+    InputJSONDelta,
+    Message,
+    MessageDeltaUsage,
+    RawContentBlockDeltaEvent,
+    RawContentBlockStartEvent,
+    RawContentBlockStopEvent,
+    RawMessageDeltaEvent,
+    RawMessageStartEvent,
+    TextBlock,
+    TextDelta,
+    ToolUseBlock,
+    Usage,
+)
+from anthropic.types.raw_message_delta_event import Delta
+
+from dhenara.ai.providers.anthropic.chat import AnthropicChat
+from dhenara.ai.providers.base import StreamingManager
+from dhenara.ai.types.genai import AIModelCallConfig
+from dhenara.ai.types.genai.ai_model import AIModelAPI, AIModelAPIProviderEnum, AIModelEndpoint
+from dhenara.ai.types.genai.foundation_models.anthropic.chat import Claude35Haiku
+
+
+def _anthropic_chat(stream_flush_chars: int) -> AnthropicChat:
+    api = AIModelAPI(provider=AIModelAPIProviderEnum.ANTHROPIC, api_key="test-anthropic-api-key")
+    endpoint = AIModelEndpoint(api=api, ai_model=Claude35Haiku)
+    config = AIModelCallConfig(streaming=True, stream_flush_chars=stream_flush_chars)
+    chat = AnthropicChat(model_endpoint=endpoint, config=config, is_async=False)
+    chat.streaming_manager = StreamingManager(model_endpoint=endpoint)
+    return chat
+
+
+def _stream_events() -> list:
+    message = Message(
+        id="msg_test",
+        content=[],
+        model=Claude35Haiku.model_name,
+        role="assistant",
+        stop_reason=None,
+        stop_sequence=None,
+        type="message",
+        usage=Usage(input_tokens=10, output_tokens=1),
+    )
+    return [
+        RawMessageStartEvent(type="message_start", message=message),
+        RawContentBlockStartEvent(type="content_block_start", index=0, content_block=TextBlock(type="text", text="")),
+        RawContentBlockDeltaEvent(type="content_block_delta", index=0, delta=TextDelta(type="text_delta", text="Let ")),
+        RawContentBlockDeltaEvent(type="content_block_delta", index=0, delta=TextDelta(type="text_delta", text="me")),
+        # Text of a block still buffered when the next block starts streaming
+        RawContentBlockStartEvent(
+            type="content_block_start",
+            index=1,
+            content_block=ToolUseBlock(type="tool_use", id="toolu_test", name="get_weather", input={}),
+        ),
+        RawContentBlockDeltaEvent(
+            type="content_block_delta",
+            index=1,
+            delta=InputJSONDelta(type="input_json_delta", partial_json='{"city": '),
+        ),
+        RawContentBlockDeltaEvent(type="content_block_delta", index=0, delta=TextDelta(type="text_delta", text=" see")),
+        RawContentBlockDeltaEvent(
+            type="content_block_delta",
+            index=1,
+            delta=InputJSONDelta(type="input_json_delta", partial_json='"Paris"}'),
+        ),
+        RawContentBlockStopEvent(type="content_block_stop", index=1),
+        RawMessageDeltaEvent(
+            type="message_delta",
+            delta=Delta(stop_reason="tool_use", stop_sequence=None),
+            usage=MessageDeltaUsage(output_tokens=20),
+        ),
+    ]
+
+
+def _emitted_content_deltas(chat: AnthropicChat) -> list:
+    emitted = []
+    for event in _stream_events():
+        for response in chat.parse_stream_chunk(event):
+            for choice_delta in response.data.choice_deltas:
+                emitted.extend((delta.index, delta.type) for delta in choice_delta.content_deltas or [])
+    return emitted
+
+
+def test_buffered_text_is_emitted_before_following_non_text_deltas():
+    chat = _anthropic_chat(stream_flush_chars=100)
+
+    emitted = _emitted_content_deltas(chat)
+
+    assert [index for index, _ in emitted] == [0, 1, 0, 1]
+    contents = chat.streaming_manager.choices[0].contents
+    assert [content.index for content in contents] == [0, 1]
+    assert contents[0].text == "Let me see"
+
+
+def test_buffered_stream_matches_unbuffered_stream():
+    buffered = _anthropic_chat(stream_flush_chars=100)
+    unbuffered = _anthropic_chat(stream_flush_chars=0)
+
+    _emitted_content_deltas(buffered)
+    _emitted_content_deltas(unbuffered)
+
+    def assembled(chat):
+        return [content.model_dump() for content in chat.streaming_manager.choices[0].contents]
+
+    assert assembled(buffered) == assembled(unbuffered)
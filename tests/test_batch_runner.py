@@ -0,0 +1,68 @@
+import asyncio
+import json
+
+import pytest
+
+from dhenara.ai import AIModelClient
+from dhenara.ai.batch import BatchRequest, BatchRunner
+from dhenara.ai.types import AIModelAPI, AIModelAPIProviderEnum, AIModelCallConfig, AIModelEndpoint
+from dhenara.ai.types.genai.foundation_models.openai.chat import GPT4oMini
+
+endpoint = AIModelEndpoint(
+    api=AIModelAPI(provider=AIModelAPIProviderEnum.OPEN_AI, api_key="test-api-key"),
+    ai_model=GPT4oMini,
+)
+
+
+def _make_runner(output_jsonl) -> BatchRunner:
+    client = AIModelClient(model_endpoint=endpoint, config=AIModelCallConfig(test_mode=True), is_async=True)
+    return BatchRunner(client, output_jsonl, retry_delay=0)
+
+
+def _read_keys(output_jsonl) -> list[str]:
+    with open(output_jsonl) as f:
+        return [json.loads(line)["key"] for line in f]
+
+
+def test_run_and_resume(tmp_path):
+    output_jsonl = tmp_path / "out.jsonl"
+    requests = [BatchRequest(prompt="first"), BatchRequest(prompt="second")]
+
+    result = asyncio.run(_make_runner(output_jsonl).run(requests))
+    assert len(result.completed) == 2
+    assert not result.skipped
+
+    result = asyncio.run(_make_runner(output_jsonl).run(requests))
+    assert not result.completed
+    assert len(result.skipped) == 2
+    assert len(_read_keys(output_jsonl)) == 2
+
+
+def test_identical_requests_without_key_are_deduplicated(tmp_path):
+    output_jsonl = tmp_path / "out.jsonl"
+    requests = [BatchRequest(prompt="same"), BatchRequest(prompt="same"), BatchRequest(prompt="other")]
+
+    result = asyncio.run(_make_runner(output_jsonl).run(requests))
+
+    assert len(result.completed) == 2
+    assert not result.failed
+    assert sorted(_read_keys(output_jsonl)) == sorted(result.completed)
+
+    result = asyncio.run(_make_runner(output_jsonl).run(requests))
+    assert len(result.skipped) == 2
+
+
+def test_identical_requests_with_distinct_keys_run_separately(tmp_path):
+    output_jsonl = tmp_path / "out.jsonl"
+    requests = [BatchRequest(prompt="same", key="a"), BatchRequest(prompt="same", key="b")]
+
+    result = asyncio.run(_make_runner(output_jsonl).run(requests))
+
+    assert sorted(result.completed) == ["a", "b"]
+
+
+def test_duplicate_explicit_keys_raise(tmp_path):
+    requests = [BatchRequest(prompt="first", key="a"), BatchRequest(prompt="second", key="a")]
+
+    with pytest.raises(ValueError, match="Duplicate request key"):
+        asyncio.run(_make_runner(tmp_path / "out.jsonl").run(requests))
@@ -0,0 +1,144 @@
+import asyncio
+import threading
+import time
+
+from dhenara.ai.providers import _client_pool
+
+
+class _Client:
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+def test_sync_client_is_created_once_and_reused():
+    created = []
+
+    def factory():
+        created.append(_Client())
+        return created[-1]
+
+    key = ("test", "reused")
+    assert _client_pool.get_sync_client(key, factory) is _client_pool.get_sync_client(key, factory)
+    assert len(created) == 1
+
+
+def test_slow_factory_does_not_block_other_keys():
+    slow_started = threading.Event()
+    release_slow = threading.Event()
+
+    def slow_factory():
+        slow_started.set()
+        release_slow.wait(5)
+        return _Client()
+
+    slow = threading.Thread(target=lambda: _client_pool.get_sync_client(("test", "slow"), slow_factory))
+    slow.start()
+    slow_started.wait(5)
+
+    start = time.monotonic()
+    client = _client_pool.get_sync_client(("test", "fast"), _Client)
+    elapsed = time.monotonic() - start
+
+    release_slow.set()
+    slow.join()
+    assert isinstance(client, _Client)
+    assert elapsed < 1
+
+
+def test_concurrent_creation_keeps_one_client_and_closes_the_others():
+    created = []
+    barrier = threading.Barrier(4)
+
+    def factory():
+        client = _Client()
+        created.append(client)
+        barrier.wait(5)
+        return client
+
+    key = ("test", "concurrent")
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(_client_pool.get_sync_client(key, factory))) for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    pooled = results[0]
+    assert all(result is pooled for result in results)
+    assert not pooled.closed
+    assert all(client.closed for client in created if client is not pooled)
+
+
+class _AsyncClient:
+    def __init__(self):
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+    def is_closed(self):
+        return self.closed
+
+
+def test_async_clients_are_pooled_per_loop():
+    key = ("test", "async")
+
+    async def get_client():
+        return (
+            await _client_pool.get_async_client(key, _AsyncClient),
+            await _client_pool.get_async_client(key, _AsyncClient),
+        )
+
+    first, second = asyncio.run(get_client())
+    other_loop_client, _ = asyncio.run(get_client())
+
+    assert first is second
+    assert other_loop_client is not first
+
+
+def test_async_pool_does_not_grow_across_asyncio_runs():
+    key = ("test", "async-runs")
+    pool_size = len(_client_pool._async_clients)
+
+    async def get_client():
+        client = await _client_pool.get_async_client(key, _AsyncClient)
+        assert len(_client_pool._async_clients) == pool_size + 1
+        return client
+
+    clients = [asyncio.run(get_client()) for _ in range(5)]
+
+    assert len(_client_pool._async_clients) == pool_size
+    assert len(_client_pool._loop_shutdown_hooks) == pool_size
+    assert all(client.closed for client in clients)
+
+
+def test_clients_of_a_closed_loop_are_evicted():
+    key = ("test", "closed-loop")
+    loop = asyncio.new_event_loop()
+    loop.run_until_complete(_client_pool.get_async_client(key, _AsyncClient))
+    # Closed without shutting down its async generators
+    loop.close()
+    assert loop in _client_pool._async_clients
+
+    asyncio.run(_client_pool.get_async_client(key, _AsyncClient))
+
+    assert loop not in _client_pool._async_clients
+    assert loop not in _client_pool._loop_shutdown_hooks
+
+
+def test_closed_async_client_is_not_reused():
+    key = ("test", "async-closed")
+
+    async def get_clients():
+        first = await _client_pool.get_async_client(key, _AsyncClient)
+        await first.close()
+        return first, await _client_pool.get_async_client(key, _AsyncClient)
+
+    first, second = asyncio.run(get_clients())
+
+    assert second is not first
@@ -0,0 +1,83 @@
+import copy
+
+from dhenara.ai.types.conversation import ConversationNode, get_conversation_context
+from dhenara.ai.types.genai.dhenara import ChatResponse
+
+
+def _make_node(user_query: str = "What is 2+2?") -> ConversationNode:
+    response = ChatResponse.model_validate(
+        {
+            "model": "test-model",
+            "provider": "anthropic",
+            "api_provider": "anthropic",
+            "choices": [
+                {
+                    "index": 0,
+                    "contents": [{"index": 0, "type": "text", "role": "assistant", "text": "4"}],
+                }
+            ],
+        }
+    )
+    return ConversationNode(user_query=user_query, response=response)
+
+
+def test_get_context_is_cached():
+    node = _make_node()
+
+    assert node.get_context() == node.get_context()
+    assert len(node._context_cache) == 1
+
+
+def test_assignment_invalidates_context():
+    node = _make_node()
+    node.get_context()
+
+    node.user_query = "edited"
+
+    assert node.get_context()[0].text == "edited"
+
+
+def test_model_copy_with_update_gets_own_context():
+    node = _make_node()
+    original_context = node.get_context()
+
+    edited = node.model_copy(update={"user_query": "edited"})
+
+    assert edited._context_cache is not node._context_cache
+    assert edited.get_context()[0].text == "edited"
+    assert node.get_context() == original_context
+    assert node.get_context()[0].text == "What is 2+2?"
+
+
+def test_copies_get_own_context_cache():
+    node = _make_node()
+    node.get_context()
+
+    for copied in (copy.copy(node), copy.deepcopy(node), node.model_copy(deep=True)):
+        assert copied._context_cache is not node._context_cache
+        assert copied.get_context() == node.get_context()
+
+
+def test_get_conversation_context_after_editing_a_copy():
+    nodes = [_make_node("first"), _make_node("second")]
+    get_conversation_context(nodes)
+
+    edited_nodes = [nodes[0], nodes[1].model_copy(update={"user_query": "second, edited"})]
+
+    assert [prompt.text for prompt in get_conversation_context(edited_nodes)][::2] == ["first", "second, edited"]
+    assert [prompt.text for prompt in get_conversation_context(nodes)][::2] == ["first", "second"]
+
+
+def test_incremental_context_matches_conversation_context():
+    nodes = []
+    context = []
+    for query in ("first", "second", "third"):
+        previous_context = get_conversation_context(nodes)
+        node = _make_node(query)
+        nodes.append(node)
+        context.extend(node.get_context())
+
+        # Each turn's context is a prefix of the next, so extending it matches a rebuild of the whole history
+        full_context = get_conversation_context(nodes)
+        assert context == full_context
+        assert full_context[: len(previous_context)] == previous_context
@@ -0,0 +1,134 @@
+import asyncio
+
+import anthropic
+import httpx
+import pytest
+
+from dhenara.ai.pool import EndpointPool, endpoint_pool, is_endpoint_failure
+from dhenara.ai.providers.anthropic.chat import AnthropicChat
+from dhenara.ai.types import AIModelCallConfig, AIModelCallResponse, ExternalApiCallStatus, ExternalApiCallStatusEnum
+from dhenara.ai.types.genai.ai_model import AIModelAPI, AIModelAPIProviderEnum, AIModelEndpoint
+from dhenara.ai.types.genai.foundation_models.anthropic.chat import Claude35Haiku, Claude37Sonnet
+
+_api = AIModelAPI(provider=AIModelAPIProviderEnum.ANTHROPIC, api_key="test-anthropic-api-key")
+_first = AIModelEndpoint(api=_api, ai_model=Claude35Haiku)
+_second = AIModelEndpoint(api=_api, ai_model=Claude37Sonnet)
+
+# Created at module level, outside any event loop
+_module_pool = EndpointPool([_first], concurrency_limit=1)
+
+
+def _response(status: ExternalApiCallStatusEnum, http_status_code: int | None = None) -> AIModelCallResponse:
+    return AIModelCallResponse(
+        status=ExternalApiCallStatus(
+            status=status,
+            api_provider=AIModelAPIProviderEnum.ANTHROPIC,
+            model="test-model",
+            message="test",
+            http_status_code=http_status_code,
+        )
+    )
+
+
+@pytest.fixture
+def fake_client(monkeypatch):
+    """Replaces the pool's AIModelClient with one returning queued results per endpoint"""
+    results: dict[str, list] = {}
+    calls: list[str] = []
+
+    class _FakeClient:
+        def __init__(self, model_endpoint, config, is_async):
+            self.model_name = model_endpoint.ai_model.model_name
+
+        async def generate_async(self, prompt, context, instructions):
+            calls.append(self.model_name)
+            result = results[self.model_name].pop(0)
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+    monkeypatch.setattr(endpoint_pool, "AIModelClient", _FakeClient)
+    return results, calls
+
+
+def test_module_level_pool_works_across_event_loops():
+    async def contend():
+        state = await _module_pool.acquire()
+        waiter = asyncio.ensure_future(_module_pool.acquire())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+        await _module_pool.release(state)
+        await _module_pool.release(await asyncio.wait_for(waiter, 1))
+
+    asyncio.run(contend())
+    asyncio.run(contend())
+
+
+def test_server_error_fails_over_and_puts_endpoint_on_cooldown(fake_client):
+    results, calls = fake_client
+    success = _response(ExternalApiCallStatusEnum.RESPONSE_RECEIVED_SUCCESS, 200)
+    results[Claude35Haiku.model_name] = [_response(ExternalApiCallStatusEnum.RESPONSE_RECEIVED_API_ERROR, 503)]
+    results[Claude37Sonnet.model_name] = [success]
+    pool = EndpointPool([_first, _second])
+
+    response = asyncio.run(pool.generate(prompt="Hello", config=AIModelCallConfig()))
+
+    assert response is success
+    assert calls == [Claude35Haiku.model_name, Claude37Sonnet.model_name]
+    assert not pool.states[0].healthy
+    assert pool.states[1].healthy
+
+
+@pytest.mark.parametrize(
+    "failed_response",
+    [
+        _response(ExternalApiCallStatusEnum.REQUEST_NOT_SEND, 400),
+        _response(ExternalApiCallStatusEnum.RESPONSE_RECEIVED_API_ERROR, 400),
+        _response(ExternalApiCallStatusEnum.INTERNAL_PROCESSING_ERROR),
+    ],
+)
+def test_request_errors_are_returned_without_failing_over(fake_client, failed_response):
+    results, calls = fake_client
+    results[Claude35Haiku.model_name] = [failed_response]
+    pool = EndpointPool([_first, _second])
+
+    response = asyncio.run(pool.generate(prompt="Hello", config=AIModelCallConfig()))
+
+    assert response is failed_response
+    assert calls == [Claude35Haiku.model_name]
+    assert all(state.healthy and state.in_flight == 0 for state in pool.states)
+
+
+def test_unexpected_exceptions_are_raised_without_cooldown(fake_client):
+    results, calls = fake_client
+    results[Claude35Haiku.model_name] = [ValueError("invalid prompt")]
+    pool = EndpointPool([_first, _second])
+
+    with pytest.raises(ValueError, match="invalid prompt"):
+        asyncio.run(pool.generate(prompt="Hello", config=AIModelCallConfig()))
+
+    assert calls == [Claude35Haiku.model_name]
+    assert all(state.healthy and state.in_flight == 0 for state in pool.states)
+
+
+def _api_error_response(exc: Exception) -> AIModelCallResponse:
+    chat = AnthropicChat(model_endpoint=_first, config=AIModelCallConfig(), is_async=True)
+    return AIModelCallResponse(status=chat._create_api_error_status(exc))
+
+
+def test_provider_api_errors_are_classified_for_failover():
+    request = httpx.Request("POST", "https://api.anthropic.com/v1/messages")
+
+    def status_error(error_class, status_code):
+        return error_class("error", response=httpx.Response(status_code, request=request), body=None)
+
+    try:
+        raise anthropic.APIConnectionError(request=request) from httpx.ConnectError("refused")
+    except anthropic.APIConnectionError as e:
+        connection_error = e
+
+    assert is_endpoint_failure(_api_error_response(connection_error))
+    assert is_endpoint_failure(_api_error_response(status_error(anthropic.InternalServerError, 500)))
+    assert is_endpoint_failure(_api_error_response(status_error(anthropic.RateLimitError, 429)))
+    assert not is_endpoint_failure(_api_error_response(status_error(anthropic.BadRequestError, 400)))
+    assert not is_endpoint_failure(_api_error_response(KeyError("content")))
@@ -0,0 +1,30 @@
+import asyncio
+
+from dhenara.ai.providers import _client_pool
+from dhenara.ai.providers.google.chat import GoogleAIChat
+from dhenara.ai.types.genai import AIModelCallConfig
+from dhenara.ai.types.genai.ai_model import AIModelAPI, AIModelAPIProviderEnum, AIModelEndpoint
+from dhenara.ai.types.genai.foundation_models.google.chat import Gemini20FlashLite
+
+
+def _google_chat() -> GoogleAIChat:
+    api = AIModelAPI(provider=AIModelAPIProviderEnum.GOOGLE_AI, api_key="test-google-api-key")
+    endpoint = AIModelEndpoint(api=api, ai_model=Gemini20FlashLite)
+    return GoogleAIChat(model_endpoint=endpoint, config=AIModelCallConfig(), is_async=True)
+
+
+def test_google_async_clients_are_closed_across_asyncio_runs():
+    pool_size = len(_client_pool._async_clients)
+
+    async def setup_client():
+        async with _google_chat() as chat:
+            client = chat._client
+            assert client is await _google_chat()._setup_client_async()
+        assert chat._client is None
+        return client
+
+    clients = [asyncio.run(setup_client()) for _ in range(5)]
+
+    assert len(_client_pool._async_clients) == pool_size
+    assert len({id(client) for client in clients}) == len(clients)
+    assert all(client._api_client._async_httpx_client.is_closed for client in clients)
@@ -0,0 +1,77 @@
+from dhenara.ai import AIModelClient
+from dhenara.ai.cache import InMemoryLRUResponseCache, SemanticResponseCache, make_response_cache_key
+from dhenara.ai.types import AIModelAPI, AIModelAPIProviderEnum, AIModelCallConfig, AIModelEndpoint
+from dhenara.ai.types.genai.foundation_models.openai.chat import GPT4oMini
+
+endpoint = AIModelEndpoint(
+    api=AIModelAPI(provider=AIModelAPIProviderEnum.OPEN_AI, api_key="test-api-key"),
+    ai_model=GPT4oMini,
+)
+config = AIModelCallConfig(test_mode=True)
+
+
+def _generate(prompt: str):
+    client = AIModelClient(model_endpoint=endpoint, config=config, is_async=False)
+    return client.generate(prompt=prompt)
+
+
+def _get_text(response) -> str:
+    return response.chat_response.choices[0].contents[0].get_text()
+
+
+def test_in_memory_cache_hit():
+    cache = InMemoryLRUResponseCache()
+    key = make_response_cache_key(model_endpoint=endpoint, config=config, prompt="hello")
+    response = _generate("hello")
+
+    cache.put(key, response)
+
+    assert cache.get(key) == response
+
+
+def test_in_memory_cache_hits_are_not_shared():
+    cache = InMemoryLRUResponseCache()
+    key = make_response_cache_key(model_endpoint=endpoint, config=config, prompt="hello")
+    response = _generate("hello")
+    original_text = _get_text(response)
+    cache.put(key, response)
+
+    hit = cache.get(key)
+    hit.chat_response.choices[0].contents[0].text = "modified"
+    hit.chat_response.choices.clear()
+
+    assert cache.get(key) is not hit
+    assert _get_text(cache.get(key)) == original_text
+
+
+def test_in_memory_cache_is_not_changed_by_the_stored_response():
+    cache = InMemoryLRUResponseCache()
+    key = make_response_cache_key(model_endpoint=endpoint, config=config, prompt="hello")
+    response = _generate("hello")
+    original_text = _get_text(response)
+    cache.put(key, response)
+
+    response.chat_response.choices[0].contents[0].text = "modified"
+
+    assert _get_text(cache.get(key)) == original_text
+
+
+def test_semantic_cache_indexes_a_key_once():
+    embedded = []
+
+    def embed(text: str) -> list[float]:
+        embedded.append(text)
+        return [float(len(text)), 1.0]
+
+    cache = SemanticResponseCache(embed_fn=embed, max_entries_per_scope=2)
+    hello_key = make_response_cache_key(model_endpoint=endpoint, config=config, prompt="hello")
+    other_key = make_response_cache_key(model_endpoint=endpoint, config=config, prompt="hello there")
+    hello_response = _generate("hello")
+
+    for _ in range(3):
+        cache.put(hello_key, hello_response)
+    cache.put(other_key, _generate("hello there"))
+
+    assert embedded == ["hello", "hello there"]
+    assert list(cache._index[hello_key.scope]) == [hello_key.digest, other_key.digest]
+    assert _get_text(cache.get(hello_key)) == _get_text(hello_response)
@@ -0,0 +1,104 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from dhenara.ai.ai_client._single_flight import SingleFlight
+
+
+def test_do_sync_coalesces_concurrent_calls():
+    single_flight = SingleFlight()
+    calls = []
+    started = threading.Event()
+
+    def fn():
+        calls.append(1)
+        started.set()
+        time.sleep(0.1)
+        return "result"
+
+    results = []
+    leader = threading.Thread(target=lambda: results.append(single_flight.do_sync("key", fn)))
+    leader.start()
+    started.wait()
+    results.append(single_flight.do_sync("key", fn))
+    leader.join()
+
+    assert results == ["result", "result"]
+    assert len(calls) == 1
+
+
+def test_do_async_coalesces_concurrent_calls():
+    single_flight = SingleFlight()
+    calls = []
+
+    async def fn():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return "result"
+
+    async def main():
+        return await asyncio.gather(*(single_flight.do_async("key", fn) for _ in range(5)))
+
+    assert asyncio.run(main()) == ["result"] * 5
+    assert len(calls) == 1
+
+
+def test_do_async_propagates_exceptions_to_all_callers():
+    single_flight = SingleFlight()
+
+    async def fn():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("boom")
+
+    async def main():
+        return await asyncio.gather(
+            single_flight.do_async("key", fn),
+            single_flight.do_async("key", fn),
+            return_exceptions=True,
+        )
+
+    results = asyncio.run(main())
+    assert [type(result) for result in results] == [RuntimeError, RuntimeError]
+
+
+def test_cancelling_the_leader_does_not_cancel_followers():
+    single_flight = SingleFlight()
+    calls = []
+
+    async def fn():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return "result"
+
+    async def main():
+        leader = asyncio.create_task(single_flight.do_async("key", fn))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(single_flight.do_async("key", fn))
+        await asyncio.sleep(0)
+
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+
+        return await follower
+
+    assert asyncio.run(main()) == "result"
+    assert len(calls) == 1
+
+
+def test_call_is_not_coalesced_after_completion():
+    single_flight = SingleFlight()
+    calls = []
+
+    async def fn():
+        calls.append(1)
+        return len(calls)
+
+    async def main():
+        first = await single_flight.do_async("key", fn)
+        second = await single_flight.do_async("key", fn)
+        return first, second
+
+    assert asyncio.run(main()) == (1, 2)
@@ -0,0 +1,67 @@
+import json
+
+import pytest
+
+from dhenara.ai.types.shared.api import SSEErrorCode, SSEErrorData, SSEEventType, SSEFrame, SSEResponse
+
+
+def _parse_error(data: str) -> SSEErrorData:
+    response = SSEResponse.parse_sse(f"event: error\ndata: {data}")
+    assert response.is_error()
+    return response.data
+
+
+def test_to_sse_format():
+    response = SSEResponse.make(data={"a": 1}, event=SSEEventType.PUSH, id="1")
+
+    head, data = response.to_sse_format().split("data: ")
+    assert head == "event: push\nid: 1\n"
+    assert data.endswith("\n\n")
+    assert json.loads(data) == {"a": 1}
+    assert response.to_sse_bytes() == SSEFrame(SSEEventType.PUSH, data.strip().encode(), "1").to_sse_bytes()
+
+
+def test_to_sse_format_multi_line_data():
+    response = SSEResponse.make(data="first\nsecond", event=SSEEventType.PUSH, retry=100)
+
+    assert response.to_sse_format() == "event: push\nid: None\nretry: 100\ndata: first\ndata: second\n\n"
+
+
+def test_parse_error_codes():
+    assert _parse_error('{"error_code": "external_api_error", "message": "m"}').error_code == (
+        SSEErrorCode.external_api_error
+    )
+    assert _parse_error('{"message": "m"}').error_code == SSEErrorCode.server_error
+
+
+@pytest.mark.parametrize(
+    ("error_code", "expected"),
+    [
+        ('"unknown"', "'unknown' is not a valid SSEErrorCode"),
+        ('["server_error"]', "['server_error'] is not a valid SSEErrorCode"),
+        ('{"code": 1}', "{'code': 1} is not a valid SSEErrorCode"),
+    ],
+)
+def test_parse_invalid_error_codes(error_code, expected):
+    data = _parse_error(f'{{"error_code": {error_code}, "message": "m"}}')
+
+    assert data.error_code == SSEErrorCode.client_decode_error
+    assert data.message == f"Failed to parse stream data: {expected}"
+
+
+def test_parse_invalid_event_type():
+    data = SSEResponse.parse_sse('event: bogus\ndata: {"a": 1}').data
+
+    assert data.error_code == SSEErrorCode.client_decode_error
+    assert data.message == "Invalid event type: bogus"
+
+
+def test_parse_with_data_type():
+    response = SSEResponse.parse_sse(
+        'event: push\nid: 3\nretry: 5\ndata: {"error_code": "server_error", "message": "x"}',
+        data_type=SSEErrorData,
+    )
+
+    assert response.event == SSEEventType.PUSH
+    assert response.data == SSEErrorData(error_code=SSEErrorCode.server_error, message="x")
+    assert (response.id, response.retry) == ("3", 5)
@@ -0,0 +1,84 @@
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+from dhenara.ai.types.genai.dhenara.request import StructuredOutputConfig
+
+
+class Address(BaseModel):
+    street_name: str
+    postal_code: str
+
+
+class Person(BaseModel):
+    full_name: str
+    first_name: str
+    home_address: Address
+    work_address: Address | None = None
+    previous_addresses: list[Address]
+    addresses_by_label: dict[str, Address]
+    attributes: dict[str, Any] = Field(default_factory=dict)
+    preferences: dict[str, Any] = {"full_name": "default"}
+
+
+_person = Person(
+    full_name="Ada Lovelace",
+    first_name="Ada",
+    home_address=Address(street_name="St James's Square", postal_code="SW1Y"),
+    work_address=None,
+    previous_addresses=[Address(street_name="Marylebone", postal_code="W1")],
+    addresses_by_label={"fn": Address(street_name="Ockham", postal_code="GU23")},
+    # Free-form keys equal to aliases of the model's properties
+    attributes={"fn": "free", "a": {"sn": 1}, "pa": [{"pc": 2}]},
+    preferences={"ha": True},
+)
+
+# The person as sent by the model with compact field names
+_compact_person = {
+    "fn": "Ada Lovelace",
+    "fn2": "Ada",
+    "ha": {"sn": "St James's Square", "pc": "SW1Y"},
+    "wa": None,
+    "pa": [{"sn": "Marylebone", "pc": "W1"}],
+    "abl": {"fn": {"sn": "Ockham", "pc": "GU23"}},
+    "a": {"fn": "free", "a": {"sn": 1}, "pa": [{"pc": 2}]},
+    "p": {"ha": True},
+}
+
+
+def test_compact_schema_aliases_properties_per_object():
+    config = StructuredOutputConfig.from_model(Person, compact_field_names=True)
+
+    schema = config.get_schema()
+
+    assert list(schema["properties"]) == ["fn", "fn2", "ha", "wa", "pa", "abl", "a", "p"]
+    assert schema["required"] == ["fn", "fn2", "ha", "pa", "abl"]
+    assert list(schema["$defs"]["Address"]["properties"]) == ["sn", "pc"]
+    # Schema keywords holding data are left alone
+    assert schema["properties"]["p"]["default"] == {"full_name": "default"}
+    assert config.output_schema["properties"]["full_name"]
+
+
+def test_compact_field_names_round_trip_nested_models_and_free_form_dicts():
+    config = StructuredOutputConfig.from_model(Person, compact_field_names=True)
+
+    expanded = config.expand_field_names(_compact_person)
+
+    assert expanded == _person.model_dump()
+    assert Person.model_validate(expanded) == _person
+
+
+def test_union_variant_with_data_is_expanded():
+    config = StructuredOutputConfig.from_model(Person, compact_field_names=True)
+    compact = {**_compact_person, "wa": {"sn": "Euston Road", "pc": "NW1"}}
+
+    expanded = config.expand_field_names(compact)
+
+    assert expanded["work_address"] == {"street_name": "Euston Road", "postal_code": "NW1"}
+
+
+def test_expand_field_names_without_compact_names_returns_data():
+    config = StructuredOutputConfig.from_model(Person)
+
+    assert config.expand_field_names(_compact_person) is _compact_person
+    assert "full_name" in config.get_schema()["properties"]